@@ -40,6 +40,7 @@ Constants: logging
     _trace_logger -- output of trace option
 
 Functions (internal):
+    _compile -- compile regular expression, reusing earlier compilations
     _quote -- return string enclosed in quotes
 """
 
@@ -106,7 +107,8 @@ class MetaPattern:
     Child class attributes:
         instances -- list of all instantiated patterns
         _flags -- flags used for compilation of regular expressions
-        _timeout -- timeout parameter for matching operations
+        _match_options -- keyword arguments for matching operations (timeout
+            and release of the global interpreter lock with regex module)
 
     Properties (read-only):
         user -- object to list in log file as user of the regular expression
@@ -160,10 +162,14 @@ class MetaPattern:
         cls._flags = re_module.MULTILINE | re_module.VERBOSE
         if re_module.__name__ == 'regex':
             cls._flags |= re_module.VERSION1
-        if re_module.__name__ == 'regex' and timeout is not None:
-            cls._timeout = {'timeout': timeout}
+        # The regex module can release the global interpreter lock while
+        # matching, which keeps the GUI responsive during extraction.
+        if re_module.__name__ == 'regex':
+            cls._match_options = {'concurrent': True}
+            if timeout is not None:
+                cls._match_options['timeout'] = timeout
         else:
-            cls._timeout = {}
+            cls._match_options = {}
 
     def __init__(self, pattern, *, compact=None, user=None, stack_index=1,
                  file=None, line=None, scope=None, **kwargs):
@@ -201,8 +207,8 @@ class MetaPattern:
         self._compact = pattern if compact is None else compact
         try:
             with Timer() as self._compilation:
-                self._compiled = Pattern.re_module.compile(pattern,
-                                                           Pattern._flags)
+                self._compiled = _compile(Pattern.re_module, pattern,
+                                          Pattern._flags)
         except Pattern.re_module.error as err:
             if err.colno is None:
                 _misc_logger.error('Error in search pattern '
@@ -288,7 +294,8 @@ class MetaPattern:
         self.print_trace('Applying')
         with self._run:
             try:
-                match = self._compiled.search(string, **Pattern._timeout)
+                match = self._compiled.search(
+                        string, **Pattern._match_options)
             except Exception as err:
                 self.print_trace('Exception in', log_level=logging.ERROR)
                 if type(err).__name__ == 'TimeoutError':
@@ -311,7 +318,8 @@ class MetaPattern:
         self.print_trace('Applying')
         with self._run:
             try:
-                matches = self._compiled.findall(string, **Pattern._timeout)
+                matches = self._compiled.findall(
+                        string, **Pattern._match_options)
             except Exception as err:
                 self.print_trace('Exception in', log_level=logging.ERROR)
                 if type(err).__name__ == 'TimeoutError':
@@ -335,7 +343,8 @@ class MetaPattern:
         self.print_trace('Applying')
         with self._run:
             try:
-                matches = self._compiled.finditer(string, **Pattern._timeout)
+                matches = self._compiled.finditer(
+                        string, **Pattern._match_options)
             except Exception as err:
                 self.print_trace('Exception in', log_level=logging.ERROR)
                 if type(err).__name__ == 'TimeoutError':
@@ -385,8 +394,8 @@ class MetaPattern:
         with self._run:
             try:
                 MetaPattern.level += 1
-                newstring, subs = self._compiled.subn(replacement, string,
-                                                      **Pattern._timeout)
+                newstring, subs = self._compiled.subn(
+                        replacement, string, **Pattern._match_options)
                 MetaPattern.level -= 1
             except Exception as err:
                 self.print_trace('Exception in', log_level=logging.ERROR)
@@ -810,7 +819,7 @@ class CatastrophicBacktracking(Exception):
             pattern = pattern_or_rule._pattern
         message = ('The following %s exceeded the timeout of %s seconds, '
                    'which led to the interruption of the extraction:\n'
-                   % (name, next(iter(pattern._timeout.values()))))
+                   % (name, pattern._match_options['timeout']))
         message += 'File: %s\n' % pattern.file
         message += 'Line: %s\n' % pattern.line
         if pattern.scope != '':
@@ -864,6 +873,27 @@ def create_classes(re_module, timeout, interruption):
 # The following elements are internal elements of the module.
 
 
+@ft.lru_cache(maxsize=4096)
+def _compile(re_module, pattern, flags):
+    """Compile regular expression, reusing earlier compilations.
+
+    Rule functions are called again for every document, creating new patterns
+    from the same strings. The internal caches of the re and regex modules are
+    too small to hold all of them, so compiled patterns are cached here
+    instead. They are immutable, and can therefore be shared by patterns of
+    successive extractions.
+
+    Arguments:
+        re_module -- regular expression module (re or regex)
+        pattern -- regular expression pattern
+        flags -- compilation flags
+
+    Returns:
+        compiled pattern
+    """
+    return re_module.compile(pattern, flags)
+
+
 def _quote(string):
     """Return string enclosed in quotes.
 
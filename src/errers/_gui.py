@@ -18,14 +18,34 @@ The following elements are internal elements of the module.
 
 Constants: text
     _UNEXPECTED, _UNEXPECTED_MESSAGE, _UNEXPECTED_DETAIL, _WORD_NOT_FOUND,
+    _PYWIN32_BROKEN,
     _CORRUPT_GEN_PY, _INVALID_INPUT_FILE, _INVALID_OUTPUT_FILE,
-    _FILENAME_REQUIRED, _DESCRIPTION, _NOTE_URL, NOTE_COPY,
-    _CLICK_INPUT_FILE, _DEBUGGING, _FILTERED, _MACOS14, _LANGUAGE_VARIANTS
+    _FILENAME_REQUIRED, _APP_TITLE, _INPUT_TITLE, _DESCRIPTION, _NOTE_URL,
+    NOTE_COPY, _CLICK_INPUT_FILE, _DEBUGGING, _FILTERED, _MACOS14,
+    _LANGUAGE_VARIANTS, _SHORTCUT_INTRO, _SHORTCUT_QUESTION, _SHORTCUT_WINDOWS,
+    _SHORTCUT_WINDOWS_DESKTOP, _SHORTCUT_MACOS, _SHORTCUT_LINUX
+
+Constants: templates (for str.format)
+    _MACOS_SCRIPT -- AppleScript of macOS shortcut
+    _LINUX_DESKTOP_ENTRY -- desktop entry of Linux shortcut
+
+Constants: other
+    _SYSTEM -- name of operating system, as returned by platform.system
+    _HAS_WIN32COM -- whether pywin32 is installed (imported only when used,
+        and reset if import fails)
+    _HAS_LOCAL_RULES -- whether local rules were loaded
+    _HAS_REGEX -- whether third-party regex module is available
+    _ICON_DIR -- folder containing application icons
+    _EXECUTABLE_DIR -- folder containing Python interpreter (or frozen app)
 
 Constants: logging
     _main_logger -- parent logger to all ERRERS loggers
     _misc_logger -- miscellaneous log messages
 
+Variables (internal):
+    _gen_py_cleared -- whether gen_py cache was already cleared by process
+    _icon -- window icon shared by all windows (loaded on first use)
+
 Classes (internal):
     _MainWindow -- main GUI window
     _HelpWindow -- window for help text
@@ -53,34 +73,38 @@ Classes (internal):
     _Language -- interface to language name from MS Word
 
 Functions (internal):
+    _report_callback_exception -- log exception raised by Tk callback
+    _import_win32com -- import pywin32, disabling its features on failure
     _dispatch -- return COM object with early-binding, clearing cache if needed
     _centre_window -- centre one window over another
     _show_error -- custom error dialog box
     _ask_yes_no -- custom yes-no dialog box
+    _wrap_dialog_text -- wrap text of dialog box (cached)
+    _wrap_text -- wrap text to given width (cached)
+    _human_join -- join items into an English list
+    _xdg_desktop_dir -- return desktop folder on Linux (cached)
 """
 
 __all__ = ['run']
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from concurrent import futures
+import contextlib
 import ctypes
 import functools as ft
 import gc
+import importlib.util
 import logging
 import os
 from pathlib import Path
 import platform
-import plistlib
 import queue
-import shutil
 import stat
-import subprocess as sp
 import sys
 import textwrap
 import time
 import threading
 import urllib
-import webbrowser
 
 try:
     import tkinter as tk
@@ -90,16 +114,6 @@ try:
     import tkinter.messagebox
 except ModuleNotFoundError:
     pass
-try:
-    import winreg
-except ModuleNotFoundError:
-    pass
-try:
-    import pythoncom
-    import win32com.client
-    import win32gui
-except ModuleNotFoundError:
-    pass
 
 import errers
 from errers import _app
@@ -110,8 +124,25 @@ from errers import _engine
 _main_logger = logging.getLogger('errers')
 _misc_logger = logging.getLogger('errers.log')
 
+# Variables
+_gen_py_cleared = False
+_icon = None
+
 # Constants
-if platform.system() == 'Darwin':
+_SYSTEM = platform.system()
+try:
+    # Look for pywin32 without importing it, as loading it is slow. Only a
+    # top-level package is looked up, as finding a submodule would import its
+    # parent package, which loads the pywin32 DLLs.
+    _HAS_WIN32COM = importlib.util.find_spec('win32com') is not None
+except ImportError:
+    _HAS_WIN32COM = False
+# Both modules are imported, if available, when the errers package loads.
+_HAS_LOCAL_RULES = 'errers.rules.local' in sys.modules
+_HAS_REGEX = 'regex' in sys.modules
+_ICON_DIR = Path(__file__).parent.joinpath('icon')
+_EXECUTABLE_DIR = Path(sys.executable).parent
+if _SYSTEM == 'Darwin':
     MOD_KEY = 'Control'
     _NOTE_URL = ('Note: left-click to open links; right-click or '
                  'control-click to copy.')
@@ -122,6 +153,8 @@ _UNEXPECTED = 'Unexpected error: please report to developer.'
 _UNEXPECTED_CONSOLE = ('Unexpected error: details written to console window. '
                        'Please report to developer.')
 _WORD_NOT_FOUND = 'Microsoft Word not found'
+_PYWIN32_BROKEN = ('Cannot load pywin32 package: document review in '
+                   'Microsoft Word disabled.')
 _WORD_UNRESPONSIVE = ('Microsoft Word is not responding. The issue may be due '
                       'to an extension added to Microsoft Windows or Word. '
                       'Please report details, which will be written to log, '
@@ -131,28 +164,27 @@ _CORRUPT_GEN_PY = ('Inter-process communication error: clearing cache to '
 _INVALID_INPUT_FILE = 'Invalid input file'
 _INVALID_OUTPUT_FILE = 'Pattern required for name of output file'
 _FILENAME_REQUIRED = 'Input file name required'
+_APP_TITLE = f'{errers.SHORTNAME} {errers.__version__}'
+_INPUT_TITLE = f'{errers.SHORTNAME} Input File'
 _DESCRIPTION = [
-    textwrap.dedent(f"""\
-        {errers.SHORTNAME} stands for {errers.LONGNAME}. The tool
-        extracts text from LaTeX files to reduce false positives when
-        checking grammar and spelling with Microsoft Word or other software.
-        Extraction is performed through application of substitution rules based
-        on regular expressions."""),
-    textwrap.dedent(f"""\
-        Current rules cover common LaTeX commands, and additional rules are
-        created automatically for those defined in a document. When needed,
-        custom rules can be defined manually in the document itself or in a
-        local.py file placed in the rules sub-directory of its installation
-        folder."""),
-    textwrap.dedent(f"""\
-        Keyboard shortcuts are available for buttons, checkboxes, and text
-        fields. For most controls, the shortcut is the {MOD_KEY} key combined
-        with the underlined letter in the control label. The only exception is
-        the Times option, for which the shortcut is {MOD_KEY}+X. In dialog
-        boxes, the enter and return keys can also be used for "Yes" and "Ok",
-        while the escape key can be used for "No" and "Cancel". Finally, the
-        tab key cycles through controls, and the space bar toggles checkboxes
-        and activates buttons."""),
+    (f'{errers.SHORTNAME} stands for {errers.LONGNAME}. The tool extracts '
+     'text from LaTeX files to reduce false positives when checking grammar '
+     'and spelling with Microsoft Word or other software. Extraction is '
+     'performed through application of substitution rules based on regular '
+     'expressions.'),
+    ('Current rules cover common LaTeX commands, and additional rules are '
+     'created automatically for those defined in a document. When needed, '
+     'custom rules can be defined manually in the document itself or in a '
+     'local.py file placed in the rules sub-directory of its installation '
+     'folder.'),
+    ('Keyboard shortcuts are available for buttons, checkboxes, and text '
+     f'fields. For most controls, the shortcut is the {MOD_KEY} key combined '
+     'with the underlined letter in the control label. The only exception is '
+     f'the Times option, for which the shortcut is {MOD_KEY}+X. In dialog '
+     'boxes, the enter and return keys can also be used for "Yes" and "Ok", '
+     'while the escape key can be used for "No" and "Cancel". Finally, the '
+     'tab key cycles through controls, and the space bar toggles checkboxes '
+     'and activates buttons.'),
     'More information at Python packaging index and in user manual:',
     ('https://pypi.org/project/errers',),
     ('https://cradpdf.drdc-rddc.gc.ca/PDFS/unc459/p813656_A1b.pdf',),
@@ -161,13 +193,12 @@ _DESCRIPTION = [
      'github.com/steve-guillouzic-gc/errers/issues'),
     'For those without a GitHub account:',
     ('mailto:steve.guillouzic@forces.gc.ca?Subject=%s'
-     % urllib.parse.quote(errers.SHORTNAME + ' ' + errers.__version__),
+     % urllib.parse.quote(_APP_TITLE),
       'steve.guillouzic@forces.gc.ca'),
     _NOTE_URL
 ]
-_NOTE_COPY = textwrap.dedent(f"""\
-    Note: copied text remains available for pasting until
-    {errers.SHORTNAME} is closed.""")
+_NOTE_COPY = ('Note: copied text remains available for pasting until '
+              f'{errers.SHORTNAME} is closed.')
 _CLICK_INPUT_FILE = 'Click here to select input file.'
 _DEBUGGING = ('These options are mostly used to debug new substitution rules. '
               'The timeout option may also be helpful on slower computers.')
@@ -175,16 +206,61 @@ _FILTERED = ('Unless the verbose option is selected, only warnings and errors '
              'appear below, and informational messages are only saved to the '
              'log file. The log below may be empty after uneventful '
              'extractions.')
-_MACOS14 = textwrap.fill(textwrap.dedent("""\
-        Starting with macOS 14, it is preferable to use Python 3.11.7 or more
-        recent, as buttons may become unresponsive with the version of Tkinter
-        included in earlier versions. There are two workarounds for the
-        unresponsiveness bug if upgrading Python is not an option: the first is
-        to use keyboard shortcuts, and the second one is to move the window
-        (which reactivates the buttons)."""), width=1000)
-_LANGUAGE_VARIANTS = textwrap.dedent("""\
-        Microsoft Word detected the following languages. Where multiple
-        variants are available, please select which one to apply.""")
+_MACOS14 = ('Starting with macOS 14, it is preferable to use Python 3.11.7 or '
+            'more recent, as buttons may become unresponsive with the version '
+            'of Tkinter included in earlier versions. There are two '
+            'workarounds for the unresponsiveness bug if upgrading Python is '
+            'not an option: the first is to use keyboard shortcuts, and the '
+            'second one is to move the window (which reactivates the '
+            'buttons).')
+_LANGUAGE_VARIANTS = ('Microsoft Word detected the following languages. Where '
+                      'multiple variants are available, please select which '
+                      'one to apply.')
+_SHORTCUT_INTRO = ('Creating shortcuts is optional, but it streamlines usage '
+                   'by providing a simple way to launch the tool and allowing '
+                   'drag-and-drop. ')
+_SHORTCUT_QUESTION = ('Which application shortcuts would you like to create '
+                      'or delete? (Creating shortcuts that already exist '
+                      'updates them to point to this '
+                      f'{errers.SHORTNAME} installation.)')
+_SHORTCUT_WINDOWS = ('For instance, right-clicking on a LaTeX file and '
+                     f'choosing {errers.SHORTNAME} under the "Open With" '
+                     'submenu launches the application GUI with the input '
+                     'file path already filled out. ')
+_SHORTCUT_WINDOWS_DESKTOP = ('Dragging a LaTeX file and dropping it on a '
+                             'desktop shortcut does the same thing.')
+_SHORTCUT_MACOS = ('For instance, dragging a LaTeX file and dropping it on '
+                   'one of the shortcuts launches the application GUI with '
+                   'the input file path already filled out. Right-clicking on '
+                   f'a LaTeX file and choosing {errers.SHORTNAME} under the '
+                   '"Open with" menu does the same thing. After creation, the '
+                   'shortcut from the Applications folder or the Launchpad '
+                   'can be dragged and dropped onto the Dock for easier '
+                   'access.')
+_SHORTCUT_LINUX = ('For instance, dragging a LaTeX file and dropping it on a '
+                   'desktop shortcut launches the application GUI with the '
+                   'input file path already filled out. Right-clicking on a '
+                   f'LaTeX file and choosing {errers.SHORTNAME} under the '
+                   '"Open With" menu does the same thing. (Note: The '
+                   'application offers to create a shortcut in the home '
+                   'folder if the desktop folder is not found.)')
+_MACOS_SCRIPT = ('on run\n'
+                 '    do shell script "{executable} &>/dev/null &"\n'
+                 'end run\n'
+                 '\n'
+                 'on open LaTeX_file\n'
+                 '    set LaTeX_path to POSIX path of LaTeX_file\n'
+                 '    set command to "{executable} --gui " & LaTeX_path\n'
+                 '    do shell script command & " &>/dev/null &"\n'
+                 'end open')
+_LINUX_DESKTOP_ENTRY = ('[Desktop Entry]\n'
+                        'Type=Application\n'
+                        f'Name={errers.SHORTNAME}\n'
+                        f'Comment={errers.LONGNAME}\n'
+                        'Icon={icon}\n'
+                        'Exec={executable} --gui %f\n'
+                        'MimeType=text/x-tex\n'
+                        'Categories=Utility\n')
 
 
 class _MainWindow:
@@ -209,33 +285,43 @@ class _MainWindow:
         __init__ -- window initializer
         reset -- reset GUI to prepare for new extraction
         set_minsize -- set minimum window size
+        schedule_minsize -- set minimum window size after a short delay
+        _set_minsize_job -- set minimum window size as scheduled
         set_title -- set window title
         ask_input_file -- prompt user for input file
+        set_input_file -- set input file path once resolved
         start_extraction -- start thread for LaTeX to text extraction
         run_extraction -- extract text from LaTeX file
         finalize_extraction -- reset GUI and handle exceptions from extraction
         copy_text -- copy text to clipboard
         copy_log -- copy log to clipboard
+        copy_file -- copy content of file to clipboard
         start_check -- start thread for grammar check
         run_check -- launch Microsoft Word and start grammar check
         finalize_check -- handle exceptions from grammar check
         on_delete -- clean up when window is closed
-        close -- close GUI, waiting for extraction interruption if needed
+        close -- close GUI, or wait for extraction interruption if needed
         update_time -- update elapsed time in the status bar
+        stop_time -- stop updating elapsed time in the status bar
 
     Attributes:
         root -- root widget of window
         log -- text box for standard error log
         _interruption -- event to interrupt extraction thread
+        _closing -- whether to close GUI once extraction is interrupted
         _inpath -- path of input file
         _outpattern -- pattern for output file name
         _outname -- name of output file
         _btn_main -- main row of buttons
+        _options -- hidden window for option specification
+        _help -- hidden help window (created on first use)
         _status -- status bar
-        _update -- process waiting to update time in the status bar
+        _update -- process waiting to update time in the status bar (None if
+            none)
         _min_width -- minimum window width
         _min_height_base -- minimum window height excluding height of field for
             input path
+        _minsize_job -- pending update of minimum window size (None if none)
     """
 
     def __init__(self, root, *, init_inpath, init_outpattern, init_patterns,
@@ -261,6 +347,9 @@ class _MainWindow:
                 substitution rules
         """
         self.root = root
+        self._closing = False
+        self._minsize_job = None
+        self._update = None
         # Create hidden options window
         self._options = _OptionsWindow(init_patterns, init_steps, init_times,
                                        init_trace, init_verbose, init_auto,
@@ -268,6 +357,8 @@ class _MainWindow:
                                        init_timeout, self.set_option_list,
                                        lambda: self._opt_list.focus())
         self._options.withdraw()
+        # Help window is created when first shown.
+        self._help = None
         # Configure main window
         root.grid_rowconfigure(0, weight=1)
         root.grid_columnconfigure(0, weight=1)
@@ -305,7 +396,7 @@ class _MainWindow:
                    ('reset', 'Reset', 0, self.reset, 'disabled'),
                    ('help', 'Help', 0, self.help, 'normal'),
                    ('quit', 'Quit', 0, self.on_delete, 'normal')]
-        if 'win32com.client' in sys.modules:
+        if _HAS_WIN32COM:
             buttons.insert(1, ('check', 'Check', 4,
                                self.start_check, 'disabled'))
         self._btn_main = _ButtonRow(controls, buttons)
@@ -322,10 +413,17 @@ class _MainWindow:
         # Status bar
         self._status = _Status(status_bar, 'Ready')
         status_bar.grid_columnconfigure(0, weight=1)
-        # Done placing widgets
-        root.update()
+        # Done placing widgets: lay them out once, so that text fields know
+        # their width when wrapping initial values below. Requested sizes are
+        # used from here on, as they do not require another layout pass.
+        root.update_idletasks()
         frame.grid_rowconfigure(1, weight=1)
         frame.grid_columnconfigure(1, weight=1)
+        self._min_width = controls.winfo_reqwidth()
+        self._min_height_base = (controls.winfo_reqheight()
+                                 + self._status.height()
+                                 - self._inpath._field.winfo_reqheight()
+                                 - self._opt_list._field.winfo_reqheight())
         # Set initial value and wrap length of input field.
         if init_inpath is None:
             self._inpath.set(_CLICK_INPUT_FILE)
@@ -341,35 +439,23 @@ class _MainWindow:
         # Set initial value and wrap length of option list
         self._opt_list.set(self._options.list())
         # Set minimum size
-        root.update()
-        self._min_width = controls.winfo_width()
-        self._min_height_base = (controls.winfo_height()
-                                 + self._status.height()
-                                 - self._inpath._field.winfo_height()
-                                 - self._opt_list._field.winfo_height())
         self.set_minsize()
-        # Keyboard shortcuts
-        root.bind(f'<{MOD_KEY}-i>', self.ask_input_file)
-        root.bind(f'<{MOD_KEY}-I>', self.ask_input_file)
-        root.bind(f'<{MOD_KEY}-o>', lambda e: self._outpattern.focus())
-        root.bind(f'<{MOD_KEY}-O>', lambda e: self._outpattern.focus())
-        root.bind(f'<{MOD_KEY}-n>', self.ask_options)
-        root.bind(f'<{MOD_KEY}-N>', self.ask_options)
-        root.bind(f'<{MOD_KEY}-e>', lambda e: self.press('extract'))
-        root.bind(f'<{MOD_KEY}-E>', lambda e: self.press('extract'))
-        root.bind(f'<{MOD_KEY}-c>', lambda e: self.press('copy text'))
-        root.bind(f'<{MOD_KEY}-C>', lambda e: self.press('copy text'))
-        root.bind(f'<{MOD_KEY}-y>', lambda e: self.press('copy log'))
-        root.bind(f'<{MOD_KEY}-Y>', lambda e: self.press('copy log'))
-        root.bind(f'<{MOD_KEY}-r>', lambda e: self.press('reset'))
-        root.bind(f'<{MOD_KEY}-R>', lambda e: self.press('reset'))
-        root.bind(f'<{MOD_KEY}-h>', lambda e: self.press('help'))
-        root.bind(f'<{MOD_KEY}-H>', lambda e: self.press('help'))
-        root.bind(f'<{MOD_KEY}-q>', lambda e: self.press('quit'))
-        root.bind(f'<{MOD_KEY}-Q>', lambda e: self.press('quit'))
-        if 'win32com.client' in sys.modules:
-            root.bind(f'<{MOD_KEY}-k>', lambda e: self.press('check'))
-            root.bind(f'<{MOD_KEY}-K>', lambda e: self.press('check'))
+        # Keyboard shortcuts: upper and lower case letters are bound to the
+        # same handler.
+        shortcuts = [('i', self.ask_input_file),
+                     ('o', lambda e: self._outpattern.focus()),
+                     ('n', self.ask_options),
+                     ('e', lambda e: self.press('extract')),
+                     ('c', lambda e: self.press('copy text')),
+                     ('y', lambda e: self.press('copy log')),
+                     ('r', lambda e: self.press('reset')),
+                     ('h', lambda e: self.press('help')),
+                     ('q', lambda e: self.press('quit'))]
+        if _HAS_WIN32COM:
+            shortcuts.append(('k', lambda e: self.press('check')))
+        for key, handler in shortcuts:
+            root.bind(f'<{MOD_KEY}-{key}>', handler)
+            root.bind(f'<{MOD_KEY}-{key.upper()}>', handler)
 
     def press(self, button_name):
         """Visually press button and invoke handler.
@@ -393,13 +479,14 @@ class _MainWindow:
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
+            self.stop_time()
             self._status.set('Ready')
             self._btn_main['extract'].config(text='Extract', state='normal',
                                              underline=0)
             self._btn_main['copy text'].config(state='disabled')
             self._btn_main['copy log'].config(state='disabled')
             self._btn_main['reset'].config(state='disabled')
-            if 'win32com.client' in sys.modules:
+            if _HAS_WIN32COM:
                 self._btn_main['check'].config(state='disabled')
             self.log.reset()
             # Stop logging to file.
@@ -408,11 +495,29 @@ class _MainWindow:
             _misc_logger.exception(_UNEXPECTED)
 
     def set_minsize(self):
-        """Set minimum windows size."""
+        """Set minimum windows size.
+
+        Requested heights are used, as they are updated as soon as the text
+        fields are resized, without waiting for the window to be redrawn.
+        """
         self.root.minsize(self._min_width,
                           self._min_height_base
-                          + self._inpath._field.winfo_height()
-                          + self._opt_list._field.winfo_height() + 180)
+                          + self._inpath._field.winfo_reqheight()
+                          + self._opt_list._field.winfo_reqheight() + 180)
+
+    def schedule_minsize(self):
+        """Set minimum window size after a short delay.
+
+        Requests received within the delay result in a single update.
+        """
+        if self._minsize_job is not None:
+            self.root.after_cancel(self._minsize_job)
+        self._minsize_job = self.root.after(50, self._set_minsize_job)
+
+    def _set_minsize_job(self):
+        """Set minimum window size as scheduled by schedule_minsize."""
+        self._minsize_job = None
+        self.set_minsize()
 
     def set_title(self):
         """Set window title.
@@ -424,7 +529,7 @@ class _MainWindow:
         if _app.valid_input_file(inpath):
             title = inpath.stem
         else:
-            title = '%s %s' % (errers.SHORTNAME, errers.__version__)
+            title = _APP_TITLE
         self.root.title(title)
 
     def help(self):
@@ -432,15 +537,16 @@ class _MainWindow:
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
-            help_window = _HelpWindow()
-            help_window.transient(self.root)
-            _set_icon(help_window)
-            help_window.withdraw()
-            help_window.update_idletasks()
-            _centre_window(self.root, help_window)
-            help_window.deiconify()
-            help_window.focus_set()
-            help_window.grab_set()
+            if self._help is None:
+                self._help = _HelpWindow()
+                self._help.withdraw()
+            self._help.transient(self.root)
+            _set_icon(self._help)
+            self._help.update_idletasks()
+            _centre_window(self.root, self._help)
+            self._help.deiconify()
+            self._help.focus_set()
+            self._help.grab_set()
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
 
@@ -451,30 +557,48 @@ class _MainWindow:
         try:
             if self._inpath.locked():
                 return
-            initial_path = Path(self._inpath.get())
-            if initial_path.is_file():
+            initial = self._inpath.get()
+            initial_path = Path(initial)
+            if os.path.isfile(initial):
                 initialfile = initial_path.name
             else:
                 initialfile = ''
-            if initial_path.parent.is_dir():
-                initialdir = initial_path.parent
-            else:
+            initialdir = os.path.dirname(initial)
+            if not os.path.isdir(initialdir):
                 initialdir = ''
             filename = tk.filedialog.askopenfilename(
                     parent=self.root,
-                    title=errers.SHORTNAME + ' Input File',
+                    title=_INPUT_TITLE,
                     filetypes=[('TeX files', '*.tex')],
                     initialdir=initialdir, initialfile=initialfile)
             # When no file is selected, filename may be an empty string or an
             # empty tuple.
             if len(filename) > 0 and filename != initial_path:
                 # Path.resolve is needed because tk_askopenfilename always uses
-                # a forward slash as directory separator.
-                self._inpath.set(Path(filename).resolve())
-                self.set_title()
-                self.reset()
-                self.root.update()
-                self.set_minsize()
+                # a forward slash as directory separator. It is run in the
+                # background, as it queries the file system, which can be slow
+                # on network drives.
+                _BackgroundTask(self.root, 'resolve_path',
+                                task=Path(filename).resolve,
+                                callback=self.set_input_file)
+            else:
+                self._inpath.focus()
+        except Exception:
+            _misc_logger.exception(_UNEXPECTED)
+
+    def set_input_file(self, future):
+        """Set input file path once resolved.
+
+        Arguments:
+            future -- resolution of path selected by user
+        """
+        # pylint: disable=broad-except
+        # Reason: exception logged
+        try:
+            self._inpath.set(future.result())
+            self.set_title()
+            self.reset()
+            self.schedule_minsize()
             self._inpath.focus()
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
@@ -508,8 +632,7 @@ class _MainWindow:
         """
         self._opt_list.set(self._options.list())
         self.reset()
-        self.root.update()
-        self.set_minsize()
+        self.schedule_minsize()
         self._opt_list.focus()
 
     def start_extraction(self):
@@ -522,7 +645,7 @@ class _MainWindow:
             self._outpattern._field.edit_modified(False)
             self._opt_list._field.edit_modified(False)
             # Check if input file path is valid.
-            if not Path(self._inpath.get()).is_file():
+            if not os.path.isfile(self._inpath.get()):
                 _show_error(root=self.root, parent=self.root,
                             message=_INVALID_INPUT_FILE)
                 self._inpath.set(_CLICK_INPUT_FILE)
@@ -547,20 +670,13 @@ class _MainWindow:
                 extensions.append('-times.csv')
             if self._options.trace.get():
                 extensions.append('-trace.txt')
-            existing = [str(outroot.stem) + ext
+            directory = outroot.parent
+            existing = [outroot.stem + ext
                         for ext in extensions
                         if outroot.with_name(outroot.stem + ext).is_file()]
             if existing:
-                all_but_last = ', '.join(existing[:-1])
-                last = existing[-1]
-                if len(existing) > 2:
-                    all_files = ', and '.join([all_but_last, last])
-                elif len(existing) == 2:
-                    all_files = ' and '.join([all_but_last, last])
-                else:
-                    all_files = last
-                directory = outroot.parent
-                message = 'Overwrite %s in %s?' % (all_files, directory)
+                message = 'Overwrite %s in %s?' % (_human_join(existing),
+                                                   directory)
                 extract = _ask_yes_no(root=self.root, parent=self.root,
                                       question=message)
                 self.root.focus_set()
@@ -568,7 +684,7 @@ class _MainWindow:
                 extract = True
             # Perform extraction.
             if extract:
-                self._update = self.root.after(0, self.update_time)
+                self._update = self.root.after_idle(self.update_time)
                 self._btn_main['extract'].config(
                         text='Extracting', state='disabled',
                         underline=-1)
@@ -594,7 +710,8 @@ class _MainWindow:
                 _BackgroundTask(self.root, 'extraction',
                                 task=self.run_extraction,
                                 kwargs=kwargs,
-                                callback=finalize)
+                                callback=finalize,
+                                dedicated=True)
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
 
@@ -657,7 +774,7 @@ class _MainWindow:
                 try:
                     self._outname = future.result()
                     self._btn_main['copy text'].config(state='normal')
-                    if 'win32com.client' in sys.modules:
+                    if _HAS_WIN32COM:
                         self._btn_main['check'].config(state='normal')
                 except Exception:
                     self._outname = outroot.with_suffix('.txt')
@@ -687,6 +804,7 @@ class _MainWindow:
                 self._btn_main['extract'].config(text='Done', underline=-1)
                 status = 'Done'
             finally:
+                self.stop_time()
                 self._status.set(self._status.get() + f' ({status})')
                 self._btn_main['copy log'].config(state='normal')
                 self._btn_main['reset'].config(state='normal')
@@ -698,16 +816,16 @@ class _MainWindow:
         finally:
             # Quitting app is delayed until _interruption event is deleted.
             del self._interruption
+            if self._closing:
+                # Close after busy cursor is restored by background task.
+                self.root.after(0, self.close)
 
     def copy_text(self):
         """Copy text to clipboard."""
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
-            with _Busy(self.root), \
-                 open(self._outname, encoding='utf-8') as text_file:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(text_file.read())
+            self.copy_file(self._outname)
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
         else:
@@ -720,20 +838,38 @@ class _MainWindow:
         try:
             logname = self._outname.parent.joinpath(self._outname.stem
                                                     + '-log.txt')
-            with _Busy(self.root), \
-                 open(logname, encoding='utf-8') as log_file:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(log_file.read())
+            self.copy_file(logname)
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
         else:
             self._status.set('Log copied to clipboard')
 
+    def copy_file(self, path):
+        """Copy content of file to clipboard.
+
+        The file is read and appended to the clipboard in 64 KiB chunks, so
+        that large files are never held in memory twice, and the display is
+        refreshed every 16 chunks.
+
+        Arguments:
+            path -- path of file
+        """
+        with _Busy(self.root), open(path, encoding='utf-8') as file:
+            self.root.clipboard_clear()
+            chunks = iter(ft.partial(file.read, 65536), '')
+            for count, chunk in enumerate(chunks, start=1):
+                self.root.clipboard_append(chunk)
+                if count % 16 == 0:
+                    self.root.update_idletasks()
+
     def start_check(self):
         """Start grammar check in separate thread."""
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
+            if not _import_win32com():
+                self._btn_main['check'].config(state='disabled')
+                return
             try:
                 with open(self._outname.resolve(), 'a'):
                     pass
@@ -753,7 +889,8 @@ class _MainWindow:
             _BackgroundTask(self.root, 'document_review',
                             task=self.run_check,
                             args=(q_detected, q_selected),
-                            callback=self.finalize_check)
+                            callback=self.finalize_check,
+                            dedicated=True)
             self.root.after(0, self.wait_for_languages, q_detected, q_selected)
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
@@ -765,8 +902,10 @@ class _MainWindow:
             q_detected -- Queue object for detected languages
             q_selected -- Queue object for selected language variants
         """
-        # pylint: disable=broad-except
-        # Reason: exception re-raised
+        # pylint: disable=broad-except,import-outside-toplevel
+        # Reason: exception re-raised; pywin32 DLLs loaded only when needed
+        import pythoncom
+        import win32com.client
         constants = win32com.client.constants
         pywintypes = win32com.client.pywintypes
         # Initialize COM libraries for this thread.
@@ -908,21 +1047,24 @@ class _MainWindow:
         try:
             if hasattr(self, '_interruption'):
                 self._interruption.set()
-                self.root.after(100, self.close)
-            else:
-                self.close()
+            self.close()
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
 
     def close(self):
-        """Close GUI, waiting for extraction interruption if needed."""
+        """Close GUI, or wait for extraction interruption if needed.
+
+        If an extraction is running, the GUI is closed by finalize_extraction
+        once the extraction thread has stopped.
+        """
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
             if hasattr(self, '_interruption'):
-                self.root.after(1000, self.close)
+                self._closing = True
             else:
                 _main_logger.handlers.clear()
+                self.log.destroy()
                 self.root.destroy()
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
@@ -930,6 +1072,9 @@ class _MainWindow:
     def update_time(self, start=None):
         """Update elapsed time in status bar.
 
+        The update is repeated when the next whole second is reached, since
+        elapsed time is displayed in seconds, until stop_time is called.
+
         Arguments:
             start -- start time (now if None)
         """
@@ -938,21 +1083,36 @@ class _MainWindow:
         try:
             if start is None:
                 start = time.monotonic()
-            if not self._status.get().endswith(')'):
-                self._status.set('Elapsed time: %d s'
-                                 % (time.monotonic() - start))
-                self._update = self.root.after(100, self.update_time, start)
+            elapsed = time.monotonic() - start
+            self._status.set('Elapsed time: %d s' % elapsed)
+            delay = 1000 - int(1000 * elapsed) % 1000
+            self._update = self.root.after(delay, self.update_time, start)
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
 
+    def stop_time(self):
+        """Stop updating elapsed time in status bar."""
+        if self._update is not None:
+            self.root.after_cancel(self._update)
+            self._update = None
+
 
 class _HelpWindow(tk.Toplevel):
-    """Window with help text."""
+    """Window with help text.
+
+    The window is created once and hidden when closed, so that it can be
+    shown again without being rebuilt.
+
+    Methods:
+        __init__ -- initializer
+        close -- hide window rather than destroy it
+    """
 
     def __init__(self, *args, **kwargs):
         """Initialize help window."""
         width = 85
         super().__init__(*args, **kwargs)
+        self.protocol('WM_DELETE_WINDOW', self.close)
         self.resizable(False, False)
         self.title('%s Help' % errers.SHORTNAME)
         description = ttk.Frame(self)
@@ -963,13 +1123,24 @@ class _HelpWindow(tk.Toplevel):
                 _Hyperlink(description, *desc)
             else:
                 _Description(description, 2, width, desc)
-        buttons = [('ok', 'Ok', 0, self.destroy, 'normal')]
+        buttons = [('ok', 'Ok', 0, self.close, 'normal')]
         _ButtonRow(description, buttons)
         # Keyboard shortcuts
-        self.bind(f'<{MOD_KEY}-o>', lambda e: self.destroy())
-        self.bind(f'<{MOD_KEY}-O>', lambda e: self.destroy())
-        self.bind('<Return>', lambda e: self.destroy())
-        self.bind('<Escape>', lambda e: self.destroy())
+        self.bind(f'<{MOD_KEY}-o>', lambda e: self.close())
+        self.bind(f'<{MOD_KEY}-O>', lambda e: self.close())
+        self.bind('<Return>', lambda e: self.close())
+        self.bind('<Escape>', lambda e: self.close())
+
+    def close(self):
+        """Hide window and return focus to main window."""
+        # pylint: disable=broad-except
+        # Reason: exception logged
+        try:
+            self.withdraw()
+            self.grab_release()
+            self.master.focus_set()
+        except Exception:
+            _misc_logger.exception(_UNEXPECTED)
 
 
 class _OptionsWindow(tk.Toplevel):
@@ -978,6 +1149,7 @@ class _OptionsWindow(tk.Toplevel):
     Methods:
         __init__ -- initializer
         destroy -- close window rather than destroy
+        on_shortcut -- run action associated with keyboard shortcut
         on_cancel -- cancel changes to option values
         on_ok -- save changes to option values
         list -- return value of enabled options as string
@@ -1000,6 +1172,8 @@ class _OptionsWindow(tk.Toplevel):
         _on_cancel -- callback function for Cancel button
         _options -- list of options
         _values -- list of option values
+        _labels -- list of checkboxes with their labels in option list
+        _shortcuts -- mapping of shortcut letters to actions
     """
 
     def __init__(self, init_patterns, init_steps, init_times, init_trace,
@@ -1059,7 +1233,7 @@ class _OptionsWindow(tk.Toplevel):
         self.nodefault = _CheckBox(controls, not init_default,
                                    'No default: omit default rules',
                                    underline=3)
-        if 'errers.rules.local' in sys.modules:
+        if _HAS_LOCAL_RULES:
             nolocal_state = 'normal'
         else:
             nolocal_state = 'disabled'
@@ -1068,7 +1242,7 @@ class _OptionsWindow(tk.Toplevel):
                                  'No local: omit local rules', nolocal_state,
                                  underline=3)
         _SectionLabel(controls, 'Regular expression module')
-        if 'regex' in sys.modules:
+        if _HAS_REGEX:
             re_state = 'normal'
         else:
             re_state = 'disabled'
@@ -1091,35 +1265,45 @@ class _OptionsWindow(tk.Toplevel):
         self._options = [self.patterns, self.steps, self.times, self.trace,
                          self.verbose, self.noauto, self.nodefault,
                          self.nolocal, self.re, self.timeout]
+        self._labels = [('patterns', self.patterns),
+                        ('steps', self.steps),
+                        ('times', self.times),
+                        ('trace', self.trace),
+                        ('verbose', self.verbose),
+                        ('no auto', self.noauto),
+                        ('no default', self.nodefault),
+                        ('no local', self.nolocal),
+                        ('re', self.re)]
         self._values = [option.get() for option in self._options]
-        # Keyboard shortcuts
-        self.bind(f'<{MOD_KEY}-p>', lambda e: self.patterns.toggle())
-        self.bind(f'<{MOD_KEY}-P>', lambda e: self.patterns.toggle())
-        self.bind(f'<{MOD_KEY}-s>', lambda e: self.steps.toggle())
-        self.bind(f'<{MOD_KEY}-S>', lambda e: self.steps.toggle())
-        self.bind(f'<{MOD_KEY}-x>', lambda e: self.times.toggle())
-        self.bind(f'<{MOD_KEY}-X>', lambda e: self.times.toggle())
-        self.bind(f'<{MOD_KEY}-t>', lambda e: self.trace.toggle())
-        self.bind(f'<{MOD_KEY}-T>', lambda e: self.trace.toggle())
-        self.bind(f'<{MOD_KEY}-v>', lambda e: self.verbose.toggle())
-        self.bind(f'<{MOD_KEY}-V>', lambda e: self.verbose.toggle())
-        self.bind(f'<{MOD_KEY}-a>', lambda e: self.noauto.toggle())
-        self.bind(f'<{MOD_KEY}-A>', lambda e: self.noauto.toggle())
-        self.bind(f'<{MOD_KEY}-d>', lambda e: self.nodefault.toggle())
-        self.bind(f'<{MOD_KEY}-D>', lambda e: self.nodefault.toggle())
-        self.bind(f'<{MOD_KEY}-l>', lambda e: self.nolocal.toggle())
-        self.bind(f'<{MOD_KEY}-L>', lambda e: self.nolocal.toggle())
-        self.bind(f'<{MOD_KEY}-m>', lambda e: self.re.toggle())
-        self.bind(f'<{MOD_KEY}-M>', lambda e: self.re.toggle())
-        self.bind(f'<{MOD_KEY}-u>', lambda e: self.timeout.focus())
-        self.bind(f'<{MOD_KEY}-U>', lambda e: self.timeout.focus())
-        self.bind(f'<{MOD_KEY}-o>', lambda e: self.on_ok())
-        self.bind(f'<{MOD_KEY}-O>', lambda e: self.on_ok())
-        self.bind(f'<{MOD_KEY}-c>', lambda e: self.on_cancel())
-        self.bind(f'<{MOD_KEY}-C>', lambda e: self.on_cancel())
+        # Keyboard shortcuts: a single binding dispatches all letters, upper
+        # and lower case, to their action.
+        self._shortcuts = {'p': self.patterns.toggle,
+                           's': self.steps.toggle,
+                           'x': self.times.toggle,
+                           't': self.trace.toggle,
+                           'v': self.verbose.toggle,
+                           'a': self.noauto.toggle,
+                           'd': self.nodefault.toggle,
+                           'l': self.nolocal.toggle,
+                           'm': self.re.toggle,
+                           'u': self.timeout.focus,
+                           'o': self.on_ok,
+                           'c': self.on_cancel}
+        self.bind(f'<{MOD_KEY}-KeyPress>', self.on_shortcut)
         self.bind('<Return>', lambda e: self.on_ok())
         self.bind('<Escape>', lambda e: self.on_cancel())
 
+    def on_shortcut(self, event):
+        """Run action associated with keyboard shortcut, if any.
+
+        Arguments:
+            event -- event details
+        """
+        action = self._shortcuts.get(event.keysym.lower())
+        if action is not None:
+            return action()
+        return None
+
     def on_cancel(self):
         """Restore values prior to callback, which closes window."""
         # pylint: disable=broad-except
@@ -1148,17 +1332,8 @@ class _OptionsWindow(tk.Toplevel):
 
     def list(self):
         """Return value of all enabled options as string."""
-        checkboxes = ('patterns',
-                      'steps',
-                      'times',
-                      'trace',
-                      'verbose',
-                      'no auto',
-                      'no default',
-                      'no local',
-                      're')
-        options = [label for label in checkboxes
-                   if getattr(self, label.replace(' ', '')).get()]
+        options = [label for label, checkbox in self._labels
+                   if checkbox.get()]
         if not self.re.get():
             options.append('max %g seconds per rule' % self.timeout.get())
         return ', '.join(options)
@@ -1174,8 +1349,14 @@ class _LanguageWindow(tk.Toplevel):
         __init__ -- initializer
         on_cancel -- cancel document review
         on_ok -- apply selected langauges and review document
+
+    Class attribute:
+        _font -- bold font shared by column headers of all language windows
+            (created on first use)
     """
 
+    _font = None
+
     def __init__(self, detected, q_selected, *args, **kwargs):
         """Initialize language window.
 
@@ -1199,10 +1380,14 @@ class _LanguageWindow(tk.Toplevel):
         languages = ttk.Frame(window)
         languages.grid(row=1, column=1)
         # Column headers
-        bold = tk.font.nametofont('TkDefaultFont').copy()
-        bold.configure(weight='bold', size=bold.cget('size') + 2)
-        header1 = ttk.Label(languages, text='Detected', font=bold)
-        header2 = ttk.Label(languages, text='Selected', font=bold)
+        if _LanguageWindow._font is None:
+            bold = tk.font.nametofont('TkDefaultFont').copy()
+            bold.configure(weight='bold', size=bold.cget('size') + 2)
+            _LanguageWindow._font = bold
+        header1 = ttk.Label(languages, text='Detected',
+                            font=_LanguageWindow._font)
+        header2 = ttk.Label(languages, text='Selected',
+                            font=_LanguageWindow._font)
         header1.grid(row=0, column=0, padx=5, pady=5)
         header2.grid(row=0, column=1, padx=5, pady=5)
         # Languages
@@ -1276,11 +1461,14 @@ class _ShortcutWindow:
         update_windows -- create or delete shortcut on Windows platform
         update_macos -- create or delete shortcut on macOS platform
         update_linux -- create or delete shortcut on Linux platform
+        _windows_shell -- return Windows Script Host shell for this update
 
     Attributes:
         root -- root widget of window
         _updaters -- mapping of folder to shortcut update function
         _checkboxes -- list of folder checkboxes
+        _shell -- Windows Script Host shell shared by shortcuts of an update
+            (None until first needed)
 
     Reference for Linux shortcuts:
         https://specifications.freedesktop.org/
@@ -1295,21 +1483,16 @@ class _ShortcutWindow:
             message -- message insert for shortcut window
         """
         self.root = root
+        self._shell = None
         root.resizable(False, False)
         root.title('%s (Version %s)' % (errers.SHORTNAME,
                                         errers.__version__))
         frame = ttk.Frame(self.root)
         frame.grid(row=0, column=0, ipadx=5, sticky='news')
         _SectionLabel(frame, 'Shortcut creation and deletion')
-        _Description(frame, 2, 85, textwrap.dedent("""\
-            Creating shortcuts is optional, but it streamlines usage by
-            providing a simple way to launch the tool and allowing
-            drag-and-drop. """))
+        _Description(frame, 2, 85, _SHORTCUT_INTRO)
         _Description(frame, 2, 85, message)
-        _Description(frame, 2, 85, textwrap.dedent("""\
-            Which application shortcuts would you like to create or delete?
-            (Creating shortcuts that already exist updates them to point to
-            this %s installation.)""" % errers.SHORTNAME))
+        _Description(frame, 2, 85, _SHORTCUT_QUESTION)
         self._updaters = updaters
         self._checkboxes = [_CheckBox(frame, 1, folder)
                             for folder in updaters]
@@ -1337,21 +1520,16 @@ class _ShortcutWindow:
             root -- root widget of window
         """
         updaters = {}
-        if 'win32com.client' in sys.modules:
+        if _import_win32com():
             updaters['Desktop'] = ft.partial(cls.update_windows_other,
                                              folder_name='Desktop')
         updaters['Open With menu'] = cls.update_windows_open_with
-        if 'win32com.client' in sys.modules:
+        if _HAS_WIN32COM:
             updaters['Start menu'] = ft.partial(cls.update_windows_other,
                                                 folder_name='StartMenu')
-        message = textwrap.dedent(f"""\
-            For instance, right-clicking on a LaTeX file and choosing
-            {errers.SHORTNAME} under the "Open With" submenu launches the
-            application GUI with the input file path already filled out. """)
-        if 'win32com.client' in sys.modules:
-            message += textwrap.dedent("""\
-                Dragging a LaTeX file and dropping it on a desktop shortcut
-                does the same thing.""")
+        message = _SHORTCUT_WINDOWS
+        if _HAS_WIN32COM:
+            message += _SHORTCUT_WINDOWS_DESKTOP
         return cls(root, updaters, message)
 
     @classmethod
@@ -1366,15 +1544,7 @@ class _ShortcutWindow:
         updaters = {'User applications folder, Launchpad, '
                     'and "Open with" menu':
                     ft.partial(cls.update_macos, folder=applications)}
-        message = textwrap.dedent(f"""\
-            For instance, dragging a LaTeX file and dropping it on one of the
-            shortcuts launches the application GUI with the input file path
-            already filled out. Right-clicking on a LaTeX file and choosing
-            {errers.SHORTNAME} under the "Open with" menu does the same thing.
-            After creation, the shortcut from the Applications folder or the
-            Launchpad can be dragged and dropped onto the Dock for easier
-            access.""")
-        return cls(root, updaters, message)
+        return cls(root, updaters, _SHORTCUT_MACOS)
 
     @classmethod
     def for_linux(cls, root):
@@ -1384,19 +1554,7 @@ class _ShortcutWindow:
             root -- root widget of window
         """
         home = Path.home()
-        config = Path(os.getenv('XDG_CONFIG_HOME',
-                                str(home.joinpath('.config'))))
-        user_dirs = config.joinpath('user-dirs.dirs')
-        try:
-            for line in user_dirs.read_text().splitlines():
-                if 'XDG_DESKTOP_DIR' in line:
-                    subdir = line.split('=', 1)[1].strip('"').split('/', 1)[1]
-                    desktop = home.joinpath(subdir)
-                    if desktop == home:
-                        desktop = home.joinpath('Desktop')
-                    break
-        except FileNotFoundError:
-            desktop = home.joinpath('Desktop')
+        desktop = _xdg_desktop_dir(home)
         data = Path(os.getenv('XDG_DATA_HOME',
                               str(home.joinpath('.local', 'share'))))
         menu = data.joinpath('applications')
@@ -1420,14 +1578,7 @@ class _ShortcutWindow:
                 = ft.partial(cls.update_linux,
                              file_path=menu.joinpath(full),
                              chmod=False)
-        message = textwrap.dedent(f"""\
-            For instance, dragging a LaTeX file and dropping it on a desktop
-            shortcut launches the application GUI with the input file path
-            already filled out. Right-clicking on a LaTeX file and choosing
-            {errers.SHORTNAME} under the "Open With" menu does the same thing.
-            (Note: The application offers to create a shortcut in the home
-            folder if the desktop folder is not found.)""")
-        cls(root, updaters, message)
+        cls(root, updaters, _SHORTCUT_LINUX)
 
     def start_update(self, delete=False):
         """Start shortcut creation in separate thread.
@@ -1456,8 +1607,36 @@ class _ShortcutWindow:
             updaters -- updater functions to run
             delete -- delete rather than create or update shortcut
         """
-        for updater in updaters:
-            updater(self, delete=delete)
+        # pylint: disable=import-outside-toplevel
+        # Reason: pywin32 DLLs loaded only when needed
+        try:
+            for updater in updaters:
+                updater(self, delete=delete)
+        finally:
+            if self._shell is not None:
+                import pythoncom
+                self._shell = None
+                pythoncom.CoUninitialize()
+
+    def _windows_shell(self):
+        """Return Windows Script Host shell for this update.
+
+        COM libraries are initialized, and the shell created, on first call
+        only. Both are released by the update method once all shortcuts are
+        updated, in the same thread.
+        """
+        # pylint: disable=import-outside-toplevel
+        # Reason: pywin32 DLLs loaded only when needed
+        import pythoncom
+        if self._shell is None:
+            # Initialize COM libraries for this thread.
+            pythoncom.CoInitialize()
+            try:
+                self._shell = _dispatch('Wscript.Shell')
+            except AttributeError as err:
+                pythoncom.CoUninitialize()
+                raise _InterProcessError from err
+        return self._shell
 
     def finalize_update(self, future):
         """Finalize update by closing window and handling exceptions.
@@ -1480,6 +1659,9 @@ class _ShortcutWindow:
         Arguments:
             delete -- delete shortcut rather than create or update it
         """
+        # pylint: disable=import-outside-toplevel
+        # Reason: module only available on Windows
+        import winreg
         if delete:
             keys = [
                 r'Software\Classes\tex_errers\shell\open\command',
@@ -1508,7 +1690,7 @@ class _ShortcutWindow:
                 command = '"%s"' % sys.executable
             else:
                 # App is not frozen
-                pyw = Path(sys.executable).parent.joinpath('pythonw.exe')
+                pyw = _EXECUTABLE_DIR.joinpath('pythonw.exe')
                 command = ('"%s" -c "import errers; errers._cli.run()"'
                            % pyw)
             keys = [
@@ -1539,12 +1721,7 @@ class _ShortcutWindow:
                 "Desktop", "SendTo" or "StartMenu")
             delete -- delete shortcut rather than create or update it
         """
-        # Initialize COM libraries for this thread.
-        pythoncom.CoInitialize()
-        try:
-            shell = _dispatch('Wscript.Shell')
-        except AttributeError as err:
-            raise _InterProcessError from err
+        shell = self._windows_shell()
         folder = Path(shell.SpecialFolders(folder_name))
         shortcut_path = folder.joinpath(errers.SHORTNAME + '.lnk')
         if delete:
@@ -1557,14 +1734,13 @@ class _ShortcutWindow:
                 shortcut.Arguments = '--gui'
             else:
                 # App is not frozen
-                executable \
-                    = Path(sys.executable).parent.joinpath('pythonw.exe')
+                executable = _EXECUTABLE_DIR.joinpath('pythonw.exe')
                 shortcut.TargetPath = '"%s"' % executable
                 shortcut.Arguments \
                     = '-c "import errers; errers._cli.run()" --gui'
             shortcut.WorkingDirectory = r'%USERPROFILE%\Documents'
             shortcut.IconLocation \
-                = str(Path(__file__).parent.joinpath('icon', 'errers.ico'))
+                = str(_ICON_DIR.joinpath('errers.ico'))
             shortcut.Save()
 
     def update_macos(self, folder, delete):
@@ -1577,6 +1753,11 @@ class _ShortcutWindow:
             folder -- folder where to create shortcut
             delete -- delete shortcut rather than create or update it
         """
+        # pylint: disable=import-outside-toplevel
+        # Reason: modules only needed for shortcut creation on macOS
+        import plistlib
+        import shutil
+        import subprocess as sp
         tmp = folder.joinpath(f'{errers.SHORTNAME}_tmp.app')
         final = folder.joinpath(f'{errers.SHORTNAME}.app')
         shutil.rmtree(str(tmp), ignore_errors=True)
@@ -1584,37 +1765,30 @@ class _ShortcutWindow:
         if not delete:
             icon_old = tmp.joinpath('Contents', 'Resources',
                                     'droplet.icns')
-            icon_new = Path(__file__).parent.joinpath('icon',
-                                                      'errers.icns')
+            icon_new = _ICON_DIR.joinpath('errers.icns')
             info_plist = tmp.joinpath('Contents', 'Info.plist')
-            executable = Path(sys.executable).parent.joinpath('errers')
-            script = textwrap.dedent(f"""\
-                on run
-                    do shell script "{executable} &>/dev/null &"
-                end run
-
-                on open LaTeX_file
-                    set LaTeX_path to POSIX path of LaTeX_file
-                    set command to "{executable} --gui " & LaTeX_path
-                    do shell script command & " &>/dev/null &"
-                end open""")
+            executable = _EXECUTABLE_DIR.joinpath('errers')
+            script = _MACOS_SCRIPT.format(executable=executable)
             folder.mkdir(parents=True, exist_ok=True)
             sp.run(['osacompile', '-o', str(tmp)], input=script,
                    universal_newlines=True, stderr=sp.PIPE, check=True)
             Path(icon_old).unlink()
             shutil.copy(str(icon_new), str(icon_old.parent))
-            with open(info_plist, 'rb') as info_file:
-                info = plistlib.load(info_file)
-                doc_types = info['CFBundleDocumentTypes']
-                doc_extensions = doc_types[0]['CFBundleTypeExtensions']
-                doc_extensions[0] = 'tex'
-                info['CFBundleName'] = 'ERRERS'
-                info['CFBundleIconFile'] = 'errers'
-                info['LSUIElement'] = True
-            with open(info_plist, 'wb') as info_file:
-                plistlib.dump(info, info_file)
-            shutil.copytree(str(tmp), str(final))
-            shutil.rmtree(str(tmp))
+            info = plistlib.loads(info_plist.read_bytes())
+            doc_types = info['CFBundleDocumentTypes']
+            doc_extensions = doc_types[0]['CFBundleTypeExtensions']
+            doc_extensions[0] = 'tex'
+            info['CFBundleName'] = 'ERRERS'
+            info['CFBundleIconFile'] = 'errers'
+            info['LSUIElement'] = True
+            info_plist.write_bytes(plistlib.dumps(info))
+            try:
+                # Both bundles are in the same folder, so renaming avoids
+                # copying the whole bundle.
+                os.replace(str(tmp), str(final))
+            except OSError:
+                shutil.copytree(str(tmp), str(final))
+                shutil.rmtree(str(tmp))
 
     def update_linux(self, file_path, chmod, delete):
         """Create or delete shortcut on Linux platform.
@@ -1627,22 +1801,23 @@ class _ShortcutWindow:
         if delete:
             file_path.unlink(missing_ok=True)
         else:
-            icon = Path(__file__).parent.joinpath('icon', 'errers.png')
-            executable = Path(sys.executable).parent.joinpath('errers')
-            content = textwrap.dedent(f"""\
-                [Desktop Entry]
-                Type=Application
-                Name={errers.SHORTNAME}
-                Comment={errers.LONGNAME}
-                Icon={icon}
-                Exec={executable} --gui %f
-                MimeType=text/x-tex
-                Categories=Utility\n""")
+            icon = _ICON_DIR.joinpath('errers.png')
+            executable = _EXECUTABLE_DIR.joinpath('errers')
+            content = _LINUX_DESKTOP_ENTRY.format(icon=icon,
+                                                  executable=executable)
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content)
-            if chmod:
-                os.chmod(file_path,
-                         os.stat(file_path).st_mode | stat.S_IXUSR)
+            # Set permissions when creating file rather than afterwards. As
+            # with write_text, the umask applies; only the owner gains the
+            # executable bit.
+            fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         0o766 if chmod else 0o666)
+            with os.fdopen(fd, 'w') as shortcut_file:
+                shortcut_file.write(content)
+                if chmod:
+                    # The mode passed to os.open is ignored for existing files.
+                    mode = os.fstat(fd).st_mode
+                    if not mode & stat.S_IXUSR:
+                        os.fchmod(fd, mode | stat.S_IXUSR)
 
 
 class _SectionLabel:
@@ -1650,8 +1825,13 @@ class _SectionLabel:
 
     Method:
         __init__ -- initializer
+
+    Class attribute:
+        _font -- bold font shared by all section labels (created on first use)
     """
 
+    _font = None
+
     def __init__(self, root, text):
         """Initialize section label.
 
@@ -1661,9 +1841,11 @@ class _SectionLabel:
             root -- parent widget
             text -- label text
         """
-        bold = tk.font.nametofont('TkDefaultFont').copy()
-        bold.configure(weight='bold', size=bold.cget('size') + 2)
-        label = ttk.Label(root, text=text, font=bold)
+        if _SectionLabel._font is None:
+            bold = tk.font.nametofont('TkDefaultFont').copy()
+            bold.configure(weight='bold', size=bold.cget('size') + 2)
+            _SectionLabel._font = bold
+        label = ttk.Label(root, text=text, font=_SectionLabel._font)
         label.grid(row=root.grid_size()[1], column=0, columnspan=2,
                    sticky='w', padx=5, pady=5)
 
@@ -1673,8 +1855,14 @@ class _SubSectionLabel:
 
     Method:
         __init__ -- initializer
+
+    Class attribute:
+        _font -- bold font shared by all sub-section labels (created on first
+            use)
     """
 
+    _font = None
+
     def __init__(self, root, text, extra_top=0):
         """Initialize sub-section label.
 
@@ -1685,9 +1873,11 @@ class _SubSectionLabel:
             text -- label text
             extra_top -- extra padding on top
         """
-        bold = tk.font.nametofont('TkDefaultFont').copy()
-        bold.configure(weight='bold')
-        label = ttk.Label(root, text=text, font=bold)
+        if _SubSectionLabel._font is None:
+            bold = tk.font.nametofont('TkDefaultFont').copy()
+            bold.configure(weight='bold')
+            _SubSectionLabel._font = bold
+        label = ttk.Label(root, text=text, font=_SubSectionLabel._font)
         label.grid(row=root.grid_size()[1], column=0, columnspan=2,
                    sticky='w', padx=5, pady=(5 + extra_top, 5))
 
@@ -1703,6 +1893,7 @@ class _TextField:
         get -- return value of text field
         set -- set value of text field
         adjust_height -- adjust field height to fit content
+        schedule_adjust_height -- adjust field height once idle
         unlock -- unlock field
         lock -- lock field
         focus -- select text and move focus to widget
@@ -1718,6 +1909,7 @@ class _TextField:
     Attribute:
         _field -- text field
         _onclick -- handler function for when user clicks on text field
+        _adjust_pending -- whether height adjustment is already scheduled
     """
 
     def __init__(self, root, initial, text, *, description='', onclick=None,
@@ -1738,10 +1930,11 @@ class _TextField:
         label = ttk.Label(root, text=text, underline=underline)
         frame = ttk.Frame(root)
         self._onclick = onclick
+        self._adjust_pending = False
         self._field = tk.Text(frame, width=30, height=1, wrap=tk.WORD,
                               relief=tk.FLAT, highlightthickness=1,
                               highlightbackground='grey70',
-                              font=tk.font.nametofont('TkDefaultFont'))
+                              font='TkDefaultFont')
         desc = ttk.Label(frame, text=description)
         row = root.grid_size()[1]
         label.grid(row=row, column=0, padx=5, sticky='nes')
@@ -1757,7 +1950,8 @@ class _TextField:
             # height automatically. The keypress method takes care of both
             # when onclick is present.
             self._field.bind('<Return>', lambda e: 'break')
-            self._field.bind('<KeyRelease>', lambda e: self.adjust_height())
+            self._field.bind('<KeyRelease>',
+                             lambda e: self.schedule_adjust_height())
         else:
             self._field.config(insertofftime=10, insertontime=0)
             self._field.bind('<Key>', self.keypress)
@@ -1780,9 +1974,19 @@ class _TextField:
 
     def adjust_height(self):
         """Adjust field height to fit content."""
-        tcl_command = '%s count -update -displaylines 1.0 end' % self._field
-        display_lines = int(self._field.tk.eval(tcl_command))
-        self._field.configure(height=display_lines)
+        self._adjust_pending = False
+        display_lines = self._field.count('1.0', 'end',
+                                          'update', 'displaylines')
+        self._field.configure(height=int(display_lines or 1))
+
+    def schedule_adjust_height(self):
+        """Adjust field height once idle.
+
+        Key releases received in a burst result in a single adjustment.
+        """
+        if not self._adjust_pending:
+            self._adjust_pending = True
+            self._field.after_idle(self.adjust_height)
 
     def unlock(self):
         """Unlock field."""
@@ -1872,9 +2076,9 @@ class _TextField:
         else:
             return 'dialog'
 
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         modifiers = mod_windows
-    elif platform.system() == 'Darwin':
+    elif _SYSTEM == 'Darwin':
         modifiers = mod_macos
     else:
         modifiers = mod_linux
@@ -2006,12 +2210,9 @@ class _PositiveField:
 
     def enable(self):
         """Enable field."""
-        if self._switch.get():
-            self._field.configure(state='disable')
-            self._label.configure(state='disable')
-        else:
-            self._field.configure(state='normal')
-            self._label.configure(state='normal')
+        state = 'disable' if self._switch.get() else 'normal'
+        self._field.configure(state=state)
+        self._label.configure(state=state)
 
     def disable(self):
         """Disable field."""
@@ -2020,7 +2221,8 @@ class _PositiveField:
 
     def focus(self):
         """Set focus to this field."""
-        self._field.select_range(0, 1000)
+        self._field.select_range(0, 'end')
+        self._field.icursor('end')
         self._field.focus_set()
 
 
@@ -2040,7 +2242,7 @@ class _Description:
             width -- width to which text must be wrapped
             text -- description text
         """
-        label = ttk.Label(root, text=textwrap.fill(text, width=width))
+        label = ttk.Label(root, text=_wrap_text(text, width))
         row = root.grid_size()[1]
         label.grid(row=row, column=0, columnspan=span, padx=5, pady=pady,
                    sticky='news')
@@ -2081,7 +2283,7 @@ class _Hyperlink:
         self._label.grid(row=row, column=0, columnspan=2, padx=5, pady=(0, 5))
         self._label.bind('<ButtonPress>', self._on_press)
         self._label.bind('<ButtonRelease-1>', self._on_release_left)
-        if platform.system() == 'Darwin':
+        if _SYSTEM == 'Darwin':
             right_click = '<ButtonRelease-2>'
             # Control + left-click = right-click on macOS
             self._label.bind('<Control-ButtonRelease-1>',
@@ -2111,13 +2313,14 @@ class _Hyperlink:
         Arguments:
             event -- event details (ignored)
         """
-        # pylint: disable=broad-except
-        # Reason: exception logged
+        # pylint: disable=broad-except,import-outside-toplevel
+        # Reason: exception logged; module only needed when link is clicked
+        import webbrowser
         try:
             self._label.configure(relief=tk.FLAT)
             if self._active:
                 _BackgroundTask(self._root, 'open_browser',
-                                task=webbrowser.open,
+                                task=webbrowser.open_new_tab,
                                 args=(self._url,),
                                 widgets=[self._label])
         except Exception:
@@ -2162,22 +2365,42 @@ class _LogBox:
     Textbox can be used as replacement for sys.stdout or sys.stderr. (Ref:
     www.blog.pythonlibrary.org/2014/07/14/tkinter-redirecting-stdout-stderr/)
 
+    The write method can be called from any thread, and it never calls Tk. All
+    widget access is done by the GUI thread, which polls the queue.
+
     Methods:
         __init__ -- initializer
         write -- queue string for addition to text box
+        _drain_queue -- write text from queue to text box
         _monitor_queue -- periodically check queue and write text to text box
         flush -- do nothing, as flushing is done automatically after writing
         get -- return value of text box
         reset -- delete text box content
+        _writable -- context manager making text box writable
         row -- return row index of location in grid
+        destroy -- stop monitoring queue
+        _on_focus_in -- make text box read-only when it receives focus
+        _on_focus_out -- make text box writable when it loses focus
 
     Attribute:
         _root -- parent widget
         _text -- Tk Text object
-        _queue -- thread-safe queue object for text to be written to text box
+        _focused -- whether text box has focus (in which case it is disabled
+            to prevent edits by user)
+        _queue -- text to be written to text box (deque appends and pops are
+            thread-safe, and the GUI thread is the only consumer)
+        _poll_ms -- current interval in milliseconds between queue checks
+            (short after activity, increasing while idle)
+        _after_id -- identifier of next scheduled check of queue
+        _max_lines -- maximum number of lines kept in text box (oldest lines
+            are deleted first)
+        _indent -- indentation of continuation lines shared by all text boxes
+            (measured on first use)
     """
 
-    def __init__(self, root, width, height):
+    _indent = None
+
+    def __init__(self, root, width, height, max_lines=5000):
         """Initialize text box.
 
         Widget is added to the last empty row of root.
@@ -2186,25 +2409,40 @@ class _LogBox:
             root -- parent widget
             width -- initial width of text field
             height -- initial height of text field
+            max_lines -- maximum number of lines kept in text box
         """
         self._root = root
+        self._max_lines = max_lines
         # Create text box and scroll bar
+        # The undo stack is not needed, as the user cannot edit the text.
         self._text = tk.Text(root, width=width, height=height,
-                             state='disabled', cursor='', wrap=tk.WORD)
+                             state='normal', cursor='', wrap=tk.WORD,
+                             undo=False, autoseparators=False, maxundo=0)
         scrollbar = ttk.Scrollbar(root, command=self._text.yview)
         self._text['yscrollcommand'] = scrollbar.set
         row = root.grid_size()[1]
         self._text.grid(row=row, column=0, sticky='news')
         scrollbar.grid(row=row, column=1, sticky='news')
         # Create tags for line formatting
-        font = tk.font.nametofont(name=self._text.cget('font'))
-        indent = font.measure('CRITICAL - ')
+        if _LogBox._indent is None:
+            font = tk.font.nametofont(name=self._text.cget('font'))
+            _LogBox._indent = font.measure('CRITICAL - ')
+        indent = _LogBox._indent
         self._text.tag_configure('first', lmargin2=indent)
         self._text.tag_configure('other', lmargin1=indent, lmargin2=indent)
+        # The text box can only be edited by the user when it has focus, so it
+        # is disabled only then. This avoids toggling its state on every
+        # insertion. Pasting with the middle mouse button does not require
+        # focus, so it is blocked separately.
+        self._focused = False
+        self._text.bind('<FocusIn>', self._on_focus_in)
+        self._text.bind('<FocusOut>', self._on_focus_out)
+        self._text.bind('<<PasteSelection>>', lambda e: 'break')
         # Create queue for inter-thread communication and schedule monitoring
         # task
-        self._queue = queue.Queue()
-        root.after(0, self._monitor_queue)
+        self._queue = deque()
+        self._poll_ms = 50
+        self._after_id = root.after(0, self._monitor_queue)
 
     def write(self, string):
         """Append string to queue, for addition to text box.
@@ -2212,26 +2450,62 @@ class _LogBox:
         Argument:
             string -- string to be appended
         """
-        self._queue.put(string)
+        # No Tk call must be made here. With a threaded Tcl, a call from a
+        # worker thread waits for the GUI thread, while the logging handler
+        # lock is held; the GUI thread would deadlock if it logged meanwhile.
+        self._queue.append(string)
 
-    def _monitor_queue(self):
+    def _drain_queue(self):
         """Append strings from queue to text box.
 
-        Called periodically.
+        All strings found in queue are inserted at once, each one as a list of
+        alternating text and tag arguments.
+
+        Returns:
+            whether text was inserted
         """
+        chunks = []
         try:
             while True:
-                string = self._queue.get(block=False)
+                string = self._queue.popleft()
                 lines = string.splitlines(keepends=True)
-                self._text.config(state='normal')
-                self._text.insert('end', lines[0], 'first')
-                for line in lines[1:]:
-                    self._text.insert('end', line, 'other')
-                self._text.config(state='disabled')
+                if lines:
+                    chunks.extend([lines[0], 'first',
+                                   ''.join(lines[1:]), 'other'])
+        except IndexError:
+            pass
+        if chunks:
+            # Only follow new text if the user has not scrolled up to read
+            # older messages.
+            at_bottom = self._text.yview()[1] >= 0.999
+            with self._writable():
+                self._text.insert('end', *chunks)
+                # Delete oldest lines, as the Text widget slows down as it
+                # grows. (The complete log is saved to file anyway.) The index
+                # is computed by Tk, and is 1.0 (no deletion) if the cap is not
+                # reached.
+                self._text.delete('1.0', 'end-1c -%d lines' % self._max_lines)
+            # Scrolling is skipped if the text box is not displayed.
+            if at_bottom and self._text.winfo_ismapped():
                 self._text.see('end')
-        except queue.Empty:
+        return bool(chunks)
+
+    def _monitor_queue(self):
+        """Append strings from queue to text box.
+
+        Called periodically from the GUI thread, so that writing threads never
+        call Tk. All strings queued since the previous check are added in a
+        single insertion. The queue is checked again after 50 ms if strings
+        were found, and the interval is doubled up to 200 ms otherwise.
+        """
+        if not self._text.winfo_exists():
+            return
+        if self._drain_queue():
             self._text.update_idletasks()
-            self._root.after(100, self._monitor_queue)
+            self._poll_ms = 50
+        else:
+            self._poll_ms = min(2 * self._poll_ms, 200)
+        self._after_id = self._root.after(self._poll_ms, self._monitor_queue)
 
     def flush(self):
         """Do nothing, as flushing is done automatically after writing.
@@ -2245,14 +2519,51 @@ class _LogBox:
 
     def reset(self):
         """Delete text box content."""
+        with self._writable():
+            self._text.delete('1.0', 'end')
+
+    @contextlib.contextmanager
+    def _writable(self):
+        """Make text box writable for the duration of a with block.
+
+        The state is only toggled if the text box has focus, as it is writable
+        otherwise, and it is restored even if an exception is raised.
+        """
+        if not self._focused:
+            yield
+            return
         self._text.config(state='normal')
-        self._text.delete('1.0', 'end')
-        self._text.config(state='disabled')
+        try:
+            yield
+        finally:
+            self._text.config(state='disabled')
 
     def row(self):
         """Return row index of location in grid."""
         return self._text.grid_info()['row']
 
+    def destroy(self):
+        """Stop monitoring queue."""
+        self._root.after_cancel(self._after_id)
+
+    def _on_focus_in(self, _):
+        """Make text box read-only when it receives focus.
+
+        Arguments:
+            event -- event details (ignored)
+        """
+        self._focused = True
+        self._text.config(state='disabled')
+
+    def _on_focus_out(self, _):
+        """Make text box writable when it loses focus.
+
+        Arguments:
+            event -- event details (ignored)
+        """
+        self._focused = False
+        self._text.config(state='normal')
+
 
 class _CheckBox:
     """Check box in GUI.
@@ -2342,14 +2653,17 @@ class _OptionList:
             label -- label of option list
             values -- values in list
             initial -- value selected initially
-            separators -- indices of separator positions in list
+            separators -- indices of values before which to insert separators
         """
         self._variable = tk.StringVar()
         self._variable.set(initial)
         label = ttk.Label(root, text=label)
         self._widget = ttk.OptionMenu(root, self._variable, initial, *values)
-        for sep in separators:
-            self._widget['menu'].insert_separator(sep)
+        # Insert from the end, so that earlier insertions do not shift the
+        # indices of later ones.
+        menu = self._widget['menu']
+        for sep in sorted(separators, reverse=True):
+            menu.insert_separator(sep)
         row = root.grid_size()[1]
         label.grid(row=row, column=0, padx=5, sticky='w')
         self._widget.grid(row=row, column=1, padx=5, sticky='w')
@@ -2461,8 +2775,8 @@ class _Status:
         return self._variable.set(value)
 
     def height(self):
-        """Return height of text field."""
-        return self._label.winfo_height()
+        """Return requested height of text field."""
+        return self._label.winfo_reqheight()
 
 
 class _Busy:
@@ -2477,6 +2791,12 @@ class _Busy:
         _root -- root widget of window
         _widgets -- sequence of widgets for which to show busy cursor
         _default -- sequence of original cursors
+        _changed -- whether any cursor differs from busy cursor (if not, the
+            display does not need to be updated)
+
+    The display is refreshed with update_idletasks rather than update, so that
+    user events are not processed, and handlers not re-entered, while the
+    cursor changes.
     """
 
     def __init__(self, root, widgets=None):
@@ -2489,24 +2809,26 @@ class _Busy:
         """
         self._root = root
         if widgets is None:
-            self._widgets = [root]
-        else:
-            self._widgets = widgets
-        if widgets is not None:
-            self._widgets += list(widgets)
+            widgets = [root]
+        # Drop duplicates, so that each cursor is set only once.
+        self._widgets = list(dict.fromkeys(widgets))
         self._default = [widget.cget('cursor') for widget in self._widgets]
+        self._changed = any(str(default) != 'watch'
+                            for default in self._default)
 
     def __enter__(self):
         """Start busy cursor."""
         for widget in self._widgets:
             widget.config(cursor='watch')
-        self._root.update()
+        if self._changed:
+            self._root.update_idletasks()
 
     def __exit__(self, exception_type, exception_value, traceback):
         """Stop busy cursor."""
         for (widget, default) in zip(self._widgets, self._default):
             widget.configure(cursor=default)
-        self._root.update()
+        if self._changed:
+            self._root.update_idletasks()
 
 
 class _BackgroundTask:
@@ -2514,19 +2836,36 @@ class _BackgroundTask:
 
     The busy cursor is displayed while the task is run.
 
+    Class attributes:
+        _executor -- task executor managing worker threads, shared by all
+            short background tasks (created on first use)
+        _running -- number of background tasks holding automatic garbage
+            collection suspended
+        _gc_lock -- lock protecting _running and the collector state
+
     Attributes:
         _root -- parent widget
         _busy -- context manager displaying busy cursor
-        _executor -- task executor managing separate thread
         _future -- object representing asynchronous execution of task
         _callback -- callable to be executed on normal task completion
+        _holds_gc -- whether task still holds garbage collection suspended
+        _poll_ms -- delay before next check of task, in milliseconds
 
     Methods:
-        _monitor -- monitor task progress and cleanup on completion
+        _run -- run task in worker thread
+        _monitor -- periodically check for task completion
+        _finish -- call callback function and restore regular cursor
+        _suspend_gc -- suspend automatic garbage collection
+        _resume_gc -- resume automatic garbage collection if no other task
+            holds it suspended
     """
 
+    _executor = None
+    _running = 0
+    _gc_lock = threading.Lock()
+
     def __init__(self, root, thread_name, *, task, args=(), kwargs={},
-                 callback=None, widgets=None):
+                 callback=None, widgets=None, dedicated=False):
         """Initialize background task.
 
         Arguments:
@@ -2541,42 +2880,124 @@ class _BackgroundTask:
                 Future.result is called directly if callback is None
             widgets -- list of widgets for which to show busy cursor (root if
                 None)
+            dedicated -- whether to run task in its own thread rather than in
+                the shared pool, so that long tasks are never delayed by other
+                ones (and do not hold up the pool themselves)
         """
         self._root = root
         self._busy = _Busy(root, widgets)
         self._busy.__enter__()
-        # Manually trigger garbage collection to avoid Tkinter objects being
-        # garbage collected in another thread.
-        gc.collect()
-        self._executor = futures.ThreadPoolExecutor(1, thread_name)
-        self._future = self._executor.submit(task, *args, **kwargs)
-        self._callback = callback
-        root.after(100, self._monitor)
+        self._holds_gc = False
+        self._suspend_gc()
+        try:
+            if dedicated:
+                # The thread exits once the task is done, as the executor is
+                # shut down right after submission.
+                executor = futures.ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix=errers.SHORTNAME)
+            else:
+                if _BackgroundTask._executor is None:
+                    _BackgroundTask._executor = futures.ThreadPoolExecutor(
+                            max_workers=4, thread_name_prefix=errers.SHORTNAME)
+                executor = _BackgroundTask._executor
+            self._callback = callback
+            # Tasks are checked from the GUI thread only, as calling Tk from
+            # the worker thread could block it forever if the main loop exits.
+            # Checks are frequent at first, so that short tasks are finalized
+            # promptly, and slow down for long ones.
+            self._poll_ms = 50
+            root.after(self._poll_ms, self._monitor)
+            self._future = executor.submit(
+                    self._run, thread_name, task, args, kwargs)
+            if dedicated:
+                executor.shutdown(wait=False)
+        except BaseException:
+            self._resume_gc()
+            raise
+
+    @staticmethod
+    def _run(thread_name, task, args, kwargs):
+        """Run task in worker thread.
+
+        Arguments:
+            thread_name -- thread name (for debugging)
+            task -- callable to be run
+            args -- positional arguments of task
+            kwargs -- keyword arguments of task
+
+        Returns:
+            return value of task
+        """
+        threading.current_thread().name = thread_name
+        return task(*args, **kwargs)
 
     def _monitor(self):
-        """Monitor task completion.
+        """Check for task completion.
 
-        On completion, call callback function and restore regular cursor.
+        The delay between checks starts at 50 ms and doubles up to 500 ms.
         """
         # pylint: disable=broad-except
         # Reason: exception logged
         try:
-            try:
-                self._future.exception(timeout=0)
-            except futures.TimeoutError:
-                self._root.after(100, self._monitor)
+            if not self._root.winfo_exists():
+                self._resume_gc()
                 return
+            if self._future.done():
+                self._finish()
+            else:
+                # Collect young garbage from the GUI thread, so that it does
+                # not pile up while automatic collection is suspended.
+                gc.collect(1)
+                self._poll_ms = min(2 * self._poll_ms, 500)
+                self._root.after(self._poll_ms, self._monitor)
+        except Exception:
+            self._resume_gc()
+            _misc_logger.exception(_UNEXPECTED)
+
+    def _finish(self):
+        """Call callback function and restore regular cursor."""
+        # pylint: disable=broad-except
+        # Reason: exception logged
+        try:
             try:
                 if self._callback is None:
                     self._future.result()
                 else:
                     self._callback(self._future)
             finally:
-                self._executor.shutdown()
+                self._resume_gc()
                 self._busy.__exit__(*sys.exc_info())
         except Exception:
             _misc_logger.exception(_UNEXPECTED)
 
+    def _suspend_gc(self):
+        """Suspend automatic garbage collection while task runs.
+
+        Tkinter objects must not be garbage collected in a worker thread, as
+        their finalizers call Tk. Automatic collection is therefore suspended
+        while tasks run, and garbage is collected from the GUI thread by the
+        periodic check instead. (Collecting everything before starting the
+        task blocked the GUI.)
+        """
+        with _BackgroundTask._gc_lock:
+            if _BackgroundTask._running == 0:
+                gc.disable()
+            _BackgroundTask._running += 1
+            self._holds_gc = True
+
+    def _resume_gc(self):
+        """Resume automatic garbage collection if no other task holds it.
+
+        Safe to call more than once, and from any thread.
+        """
+        with _BackgroundTask._gc_lock:
+            if not self._holds_gc:
+                return
+            self._holds_gc = False
+            _BackgroundTask._running -= 1
+            if _BackgroundTask._running == 0:
+                gc.enable()
+
 
 class _CheckCancelled(Exception):
     """Exception raised when document review is cancelled by user."""
@@ -2635,13 +3056,14 @@ class _Language:
         Arguments:
             local_name -- local name provided by MS Word
         """
-        try:
-            self.full = local_name
-            base, variant = self.full.split('(', maxsplit=1)
-            self.base = base[:-1]
-            self.variant = variant[0:-1]
-        except ValueError:
-            self.base = self.full
+        self.full = local_name
+        base, separator, variant = local_name.partition('(')
+        if separator:
+            self.base = base.rstrip()
+            # Remove only the closing parenthesis matching the opening one.
+            self.variant = variant[:-1] if variant.endswith(')') else variant
+        else:
+            self.base = local_name
             self.variant = None
 
 
@@ -2670,13 +3092,14 @@ def run(init_inpath=None, *, init_outpattern=_app.OUTPATTERN,
     # pylint: disable=broad-except
     # Reason: exception logged
     _app.set_log_stream(sys.stderr)
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         ctypes.windll.shcore.SetProcessDpiAwareness(1)
     try:
         root = tk.Tk(className=f'ca.gc.drdc_rddc.{errers.SHORTNAME}')
+        root.report_callback_exception = _report_callback_exception
         root.withdraw()
         _set_icon(root)
-        if platform.system() == 'Darwin':
+        if _SYSTEM == 'Darwin':
             # Set font color of disabled buttons manually to ensure they are
             # greyed on macOS too.
             style = ttk.Style()
@@ -2700,7 +3123,7 @@ def run(init_inpath=None, *, init_outpattern=_app.OUTPATTERN,
         _app.set_log_stream(main_window.log)
         # Warn of tkinter bug for macOS >= 14. Rely on Darwin version, because
         # platform.mac_ver() does not return more than 10.16 on python < 3.8.
-        if (platform.system() == 'Darwin'
+        if (_SYSTEM == 'Darwin'
                 and int(platform.release().split('.')[0]) >= 23
                 and sys.version_info < (3, 11, 7)):
             _misc_logger.warning(_MACOS14)
@@ -2716,15 +3139,16 @@ def update_shortcuts():
     # pylint: disable=broad-except
     # Reason: exception logged
     _app.set_log_stream(sys.stderr)
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         sw_init = _ShortcutWindow.for_windows
-    elif platform.system() == 'Darwin':
+    elif _SYSTEM == 'Darwin':
         sw_init = _ShortcutWindow.for_macos
     else:
         # Attempt same method as Linux for all other platforms.
         sw_init = _ShortcutWindow.for_linux
     try:
         root = tk.Tk()
+        root.report_callback_exception = _report_callback_exception
         root.withdraw()
         _set_icon(root)
         sw_init(root)
@@ -2734,22 +3158,66 @@ def update_shortcuts():
         _misc_logger.exception(_UNEXPECTED)
 
 
+def _report_callback_exception(exc_type, exc_value, exc_traceback):
+    """Log exception raised by Tk callback.
+
+    Exceptions not handled by callbacks are logged like those caught by them,
+    rather than printed to the standard error stream, which is not visible
+    when the GUI is started without a console.
+
+    Arguments:
+        exc_type, exc_value, exc_traceback -- exception details
+    """
+    _misc_logger.error(_UNEXPECTED,
+                       exc_info=(exc_type, exc_value, exc_traceback))
+
+
 def _set_icon(root):
     """Set window icon.
 
+    The icon is loaded once and reused for all windows sharing the same Tcl
+    interpreter.
+
     Argument:
         root -- root widget of window
     """
-    if platform.system() == 'Windows':
-        # The 32x32 icon looks better on Windows.
-        icon_name = 'errers32.png'
-    else:
-        # The 256x256 icon looks better on macOS when using Command-Tab. It
-        # doesn't seem to matter on Linux.
-        icon_name = 'errers.png'
-    icon_path = Path(__file__).parent.joinpath('icon', icon_name)
-    photo = tk.PhotoImage(file=icon_path)
-    root.iconphoto(False, photo)
+    # pylint: disable=global-statement
+    # Reason: icon shared by all windows
+    global _icon
+    if _icon is None or _icon.tk is not root.tk:
+        if _SYSTEM == 'Windows':
+            # The 32x32 icon looks better on Windows.
+            icon_name = 'errers32.png'
+        else:
+            # The 256x256 icon looks better on macOS when using Command-Tab. It
+            # doesn't seem to matter on Linux.
+            icon_name = 'errers.png'
+        icon_path = _ICON_DIR.joinpath(icon_name)
+        _icon = tk.PhotoImage(master=root, file=icon_path)
+    root.iconphoto(False, _icon)
+
+
+def _import_win32com():
+    """Import pywin32, disabling its features on failure.
+
+    At startup, pywin32 is only looked up, as loading it is slow. It is
+    imported the first time it is needed, which may still fail, for instance
+    if its DLLs are missing. Features relying on it are then disabled.
+
+    Returns:
+        whether pywin32 was imported
+    """
+    # pylint: disable=global-statement
+    # Reason: flag shared by all windows
+    global _HAS_WIN32COM
+    if _HAS_WIN32COM:
+        try:
+            importlib.import_module('pythoncom')
+            importlib.import_module('win32com.client')
+        except ImportError:
+            _HAS_WIN32COM = False
+            _misc_logger.error(_PYWIN32_BROKEN, exc_info=True)
+    return _HAS_WIN32COM
 
 
 def _dispatch(prog_id, new_instance=False):
@@ -2762,14 +3230,22 @@ def _dispatch(prog_id, new_instance=False):
     Returns:
         COM object
     """
+    # pylint: disable=import-outside-toplevel,global-statement
+    # Reason: modules only needed when dispatching; flag shared by threads
+    import shutil
+    import win32com.client
+    global _gen_py_cleared
     gencache = win32com.client.gencache
     try:
         if new_instance:
             prog_id = win32com.client.DispatchEx(prog_id)
         com_object = gencache.EnsureDispatch(prog_id)
     except AttributeError:
-        # Delete gen_py cache generated by makepy, and reraise exception.
-        shutil.rmtree(gencache.GetGeneratePath(), ignore_errors=True)
+        # Delete gen_py cache generated by makepy, and reraise exception. The
+        # cache is deleted only once per process, as regenerating it is slow.
+        if not _gen_py_cleared:
+            _gen_py_cleared = True
+            shutil.rmtree(gencache.GetGeneratePath(), ignore_errors=True)
         raise
     return com_object
 
@@ -2782,7 +3258,7 @@ def _centre_window(parent, child):
         child -- window to be centred
     """
     # Assume child windows are already centred on Linux.
-    if platform.system() in ('Darwin', 'Windows'):
+    if _SYSTEM in ('Darwin', 'Windows'):
         x_shift = (parent.winfo_width() - child.winfo_reqwidth()) // 2
         y_shift = (parent.winfo_height() - child.winfo_reqheight()) // 2
         child.geometry('+%d+%d' % (parent.winfo_x() + x_shift,
@@ -2805,7 +3281,7 @@ def _show_error(root, parent, message):
     frame = ttk.Frame(dialog)
     frame.grid(row=0, column=0)
     icon = ttk.Label(frame, image='::tk::icons::error')
-    text = ttk.Label(frame, text=textwrap.fill(message, width=60))
+    text = ttk.Label(frame, text=_wrap_dialog_text(message))
     ok = ttk.Button(frame, text='Ok', underline=0,
                     command=dialog.destroy)
     icon.grid(row=0, column=0, padx=(20, 5), pady=10, sticky='n')
@@ -2856,7 +3332,7 @@ def _ask_yes_no(root, parent, question):
     frame = ttk.Frame(dialog)
     frame.grid(row=0, column=0)
     icon = ttk.Label(frame, image='::tk::icons::question')
-    text = ttk.Label(frame, text=textwrap.fill(question, width=60))
+    text = ttk.Label(frame, text=_wrap_dialog_text(question))
     buttons = ttk.Frame(frame)
     icon.grid(row=0, column=0, padx=(20, 5), pady=10, sticky='n')
     text.grid(row=0, column=1, padx=(0, 30), pady=10)
@@ -2888,3 +3364,85 @@ def _ask_yes_no(root, parent, question):
     dialog.grab_set()
     parent.wait_window(dialog)
     return answer
+
+
+@ft.lru_cache(maxsize=32)
+def _wrap_dialog_text(text):
+    """Wrap text of dialog box.
+
+    Results are cached, as the same messages tend to be displayed repeatedly.
+    Short single-line messages are returned as is.
+
+    Arguments:
+        text -- text to wrap
+
+    Returns:
+        wrapped text
+    """
+    if len(text) <= 60 and '\n' not in text:
+        return text
+    return textwrap.fill(text, width=60)
+
+
+@ft.lru_cache(maxsize=64)
+def _wrap_text(text, width):
+    """Wrap text to given width.
+
+    Results are cached, as descriptions are wrapped again whenever their
+    window is rebuilt.
+
+    Arguments:
+        text -- text to wrap
+        width -- maximum line length
+
+    Returns:
+        wrapped text
+    """
+    return textwrap.fill(text, width=width)
+
+
+def _human_join(items):
+    """Join items into an English list.
+
+    Arguments:
+        items -- non-empty list of strings
+
+    Returns:
+        items separated by commas, with "and" before the last one
+    """
+    if len(items) == 1:
+        return items[0]
+    separator = ', and ' if len(items) > 2 else ' and '
+    return ', '.join(items[:-1]) + separator + items[-1]
+
+
+@ft.lru_cache(maxsize=1)
+def _xdg_desktop_dir(home):
+    """Return desktop folder on Linux.
+
+    The folder is read from the user-dirs.dirs file of the XDG configuration
+    folder. Only the XDG_DESKTOP_DIR line is parsed, and the Desktop folder of
+    the home directory is returned if it is not found.
+
+    Arguments:
+        home -- home directory of user
+
+    Returns:
+        path of desktop folder
+    """
+    config = Path(os.getenv('XDG_CONFIG_HOME',
+                            str(home.joinpath('.config'))))
+    try:
+        text = config.joinpath('user-dirs.dirs').read_text()
+    except FileNotFoundError:
+        return home.joinpath('Desktop')
+    start = text.find('XDG_DESKTOP_DIR=')
+    if start == -1:
+        return home.joinpath('Desktop')
+    end = text.find('\n', start)
+    line = text[start:] if end == -1 else text[start:end]
+    subdir = line.partition('=')[2].strip().strip('"').partition('/')[2]
+    desktop = home.joinpath(subdir)
+    if desktop == home:
+        desktop = home.joinpath('Desktop')
+    return desktop
@@ -90,6 +90,19 @@ def core_location(Rule, RuleList, **_):
     placeholder name; and \def, \edef, \gdef and \xdef using \def as
     placeholder name.
     """
+    # Line numbers are counted incrementally, as the rules scan the document
+    # from start to end: only the newlines since the previous match are
+    # counted.
+    previous = {'string': None, 'start': 0, 'line': 1}
+
+    def line_number(m):
+        start = m.start(0)
+        if m.string is not previous['string'] or start < previous['start']:
+            previous.update(string=m.string, start=0, line=1)
+        previous['line'] += m.string.count('\n', previous['start'], start)
+        previous['start'] = start
+        return previous['line']
+
     return RuleList([
         Rule(
             textwrap.dedent(r"""
@@ -98,7 +111,7 @@ def core_location(Rule, RuleList, **_):
                 %C"""),
             lambda m, file_name: r'\newcommand{%s}(%s)%s(%s)'
                                  % (m['c1'],
-                                    m.string.count('\n', 0, m.start(0)) + 1,
+                                    line_number(m),
                                     m['space'],
                                     file_name)),
         Rule(
@@ -108,7 +121,7 @@ def core_location(Rule, RuleList, **_):
                 %c"""),
             lambda m, file_name: r'\newenvironment{%s}(%s)%s(%s)'
                                  % (m['c1'],
-                                    m.string.count('\n', 0, m.start(0)) + 1,
+                                    line_number(m),
                                     m['space'],
                                     file_name)),
         Rule(
@@ -121,7 +134,7 @@ def core_location(Rule, RuleList, **_):
                 """),
             lambda m, file_name: r'\def{%s}(%s)%s(%s)%s{%s}'
                                  % (m['name'],
-                                    m.string.count('\n', 0, m.start(0)) + 1,
+                                    line_number(m),
                                     m['space1'],
                                     file_name,
                                     m['space2'],
@@ -133,7 +146,7 @@ def core_location(Rule, RuleList, **_):
                 %C"""),
             lambda m, file_name: r'\newcounter{%s}(%s)%s(%s)'
                                  % (m['c1'],
-                                    m.string.count('\n', 0, m.start(0)) + 1,
+                                    line_number(m),
                                     m['space'],
                                     file_name))
     ])
@@ -155,6 +168,9 @@ def core_insertion(*, Rule, RuleList, document, not_commented, read_file, **_):
 
 def core_removal(*, Rule, RuleList, not_escaped, **_):
     """Return text removal rules run at start of extraction."""
+    # verbatim: replacement of verbatim text, by name of matching alternative
+    # (comments are kept as is)
+    verbatim = {'verb': '||', 'verbatim': ''}
     return RuleList([
         # Remove \verb commands and verbatim environments. The first rule saves
         # the environment name in an optional argument for use in the second
@@ -185,14 +201,24 @@ def core_removal(*, Rule, RuleList, not_escaped, **_):
                      \\end{(?P=s1)}                  # end of environment.
                  )
              )""",
-             lambda m: ((m['comment'] or '')
-                        + ('||' if m['verb'] else ''))),
+             lambda m: verbatim.get(m.lastgroup, m[0])),
         # Remove comments: comment-only lines are removed; empty lines
         # following end-of-line comments are kept; non-empty lines following
-        # end-of-line comments are wrapped up.
-        Rule(fr'^%h{not_escaped}%.*\n', ''),
-        Rule(fr'{not_escaped}%.*\n%h\n', r'\n\n'),
-        Rule(fr'{not_escaped}%.*%n', ''),
+        # end-of-line comments are wrapped up. All three cases are handled in
+        # a single pass, so an empty line is also kept if comment-only lines
+        # separate it from the end-of-line comment.
+        Rule(fr"""
+             (?P<line>^%h{not_escaped}%.*\n)  # Comment-only line
+             |
+             (?P<para>                        # End-of-line comment followed
+                 {not_escaped}%.*\n           # by empty line (possibly after
+                 (?:%h%.*\n)*+                # comment-only lines)
+                 %h\n
+             )
+             |
+             (?P<wrap>{not_escaped}%.*%n)     # Other end-of-line comment
+             """,
+             lambda m: '\n\n' if m.lastgroup == 'para' else ''),
         # Remove lines dealing with internal commands
         Rule(r'(?s)\\makeatletter.*?\\makeatother', ''),
         # Replace math expressions by $$. It is done here to prevent other
@@ -268,6 +294,8 @@ def core_setup(*, Rule, RuleList, **_):
         Rule(r'\\`', r'\n\n'),
         Rule(r'\\(?:push|pop)tabs', '')
     ])
+    # ligatures: ligature characters and their letters
+    ligatures = {'ﬀ': 'ff', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬃ': 'ffi', 'ﬄ': 'ffl'}
     return RuleList([
         # Tabbing environment
         Rule(r"""(?s)                         # Period matches \n too.
@@ -345,27 +373,20 @@ def core_setup(*, Rule, RuleList, **_):
         # Replace explicit space commands by '\ ', except for negative spaces
         # which are simply removed.
         Rule(r'\\[,>:;]', r'\\ '),
-        Rule(r'\\(?:thin|med|thick)space', r'\\ '),
-        Rule(r'\\q?quad', r'\\ '),
+        Rule(r'\\(?:thinspace|medspace|thickspace|quad|qquad)', r'\\ '),
         Rule(r'\\!', ''),
         Rule(r'\\neg(?:thin|med|thick)space', r''),
-        # Font and alignment
-        Rule(r'\\(?:Huge|huge|LARGE|Large|large|normalsize)', ''),
-        Rule(r'\\(?:small|footnotesize|scriptsize|tiny)', ''),
-        Rule(r'\\centering', ''),
-        Rule(r'\\ragged(?:left|right)', ''),
-        Rule(r'\\(?:no)?indent', ''),
+        # Font and alignment. (Alternations are kept flat, so that the command
+        # names are recognized as such when the patterns are extended.)
+        Rule(r'\\(?:Huge|huge|LARGE|Large|large|normalsize|small|footnotesize'
+             r'|scriptsize|tiny|centering|raggedleft|raggedright|noindent'
+             r'|indent)', ''),
         # Counters
-        Rule(r'\\the(?:part|chapter|section|subsection|subsubsection)', 'X'),
-        Rule(r'\\the(?:paragraph|subparagraph|figure|table)', 'X'),
-        Rule(r'\\the(?:footnote|mpfootnote|enumi|enumii|enumiii|enumiv)', 'X'),
-        Rule(r'\\the(?:page|equation)', 'X'),
+        Rule(r'\\the(?:part|chapter|section|subsection|subsubsection'
+             r'|paragraph|subparagraph|figure|table|footnote|mpfootnote|enumi'
+             r'|enumii|enumiii|enumiv|page|equation)', 'X'),
         # Ligatures: not LaTeX specific.
-        Rule('ﬀ', 'ff'),
-        Rule('ﬁ', 'fi'),
-        Rule('ﬂ', 'fl'),
-        Rule('ﬃ', 'ffi'),
-        Rule('ﬄ', 'ffl')
+        Rule('[ﬀﬁﬂﬃﬄ]', lambda m: ligatures[m[0]])
     ])
 
 
@@ -75,3 +75,88 @@ def test_package_fancyvrb_removal(caplog, re_module, input_, expected):
     rules.extend(standard.core_removal(Rule=Rule, RuleList=RuleList,
                                        auto=True, not_escaped=NOT_ESCAPED))
     assert rules.sub(input_) == expected
+
+
+core_removal_comments = [
+        # Comment-only lines
+        ('% foo\nbar\n', 'bar\n'),
+        ('bar\n  % foo\n', 'bar\n'),
+        # End-of-line comments followed by empty line
+        ('foo % bar\n\nbaz', 'foo \n\nbaz'),
+        ('foo % bar\n% qux\n\nbaz', 'foo \n\nbaz'),
+        ('foo % bar\n  % qux\n  \nbaz', 'foo \n\nbaz'),
+        # End-of-line comments followed by non-empty line
+        ('foo % bar\nbaz', 'foo baz'),
+        ('foo % bar\n% qux\nbaz', 'foo baz'),
+        # Comment at end of file
+        ('foo % bar', 'foo '),
+        ('foo\n% bar', 'foo\n'),
+        # Escaped percent signs
+        (r'50\% off', r'50\% off'),
+        ('50\\% off % foo\nbar', '50\\% off bar'),
+        # Escaped backslashes before percent signs
+        ('foo\\\\% bar\nbaz', 'foo\\\\baz'),
+        ('foo\\\\% bar', 'foo\\\\')
+    ]
+
+
+@pytest.mark.parametrize('re_module', [regex, re])
+@pytest.mark.parametrize(('input_', 'expected'), core_removal_comments)
+def test_core_removal_comments(caplog, re_module, input_, expected):
+    caplog.set_level(logging.ERROR)
+    Pattern, Rule, RuleList = errers.create_classes(re_module, TIMEOUT)
+    rules = standard.core_removal(Rule=Rule, RuleList=RuleList, auto=True,
+                                  not_escaped=NOT_ESCAPED)
+    assert rules.sub(input_) == expected
+
+
+core_setup = [
+        # Accents
+        (r"\'e", 'é'),
+        (r'\c c', 'ç'),
+        (r'\H{o}', 'ő'),
+        (r'\r{a}', 'å'),
+        (r'\u{ab}', 'ăb'),
+        (r'\"{\'a}', '\u00e1\u0308'),
+        # Commands starting with the name of an accent command
+        (r'\Huge text', 'text'),
+        (r'\ref{x}', r'\ref{x}'),
+        (r'\Hi', r'\Hi'),
+        # Spaces
+        (r'a\quad b', r'a\ b'),
+        (r'a\qquad b', r'a\ b'),
+        # Ligatures
+        ('ﬁ\\foo', 'fi\\foo'),
+        ('\\foo ﬁne', '\\foo fine'),
+        ('e\\ﬀect', 'e\\ffect')
+    ]
+
+
+@pytest.mark.parametrize('re_module', [regex, re])
+@pytest.mark.parametrize(('input_', 'expected'), core_setup)
+def test_core_setup(caplog, re_module, input_, expected):
+    caplog.set_level(logging.ERROR)
+    Pattern, Rule, RuleList = errers.create_classes(re_module, TIMEOUT)
+    rules = standard.core_setup(Rule=Rule, RuleList=RuleList, auto=True)
+    assert rules.sub(input_) == expected
+
+
+core_location = [
+        (r'\newcommand{\foo}{x}', r'\newcommand{\foo}(1)(f.tex){x}'),
+        ('a\n\\newcommand{\\foo}{x}\nb\n\n\\renewenvironment{bar}{y}{z}\n'
+         '\\def\\baz{w}\n\\providecommand*\n{\\qux}{v}',
+         'a\n\\newcommand{\\foo}(2)(f.tex){x}\nb\n\n'
+         '\\newenvironment{bar}(5)(f.tex){y}{z}\n'
+         '\\def{\\baz}(6)(f.tex){}{w}\n\\newcommand{\\qux}(7)\n(f.tex){v}')
+    ]
+
+
+@pytest.mark.parametrize('re_module', [regex, re])
+@pytest.mark.parametrize(('input_', 'expected'), core_location)
+def test_core_location(caplog, re_module, input_, expected):
+    caplog.set_level(logging.ERROR)
+    Pattern, Rule, RuleList = errers.create_classes(re_module, TIMEOUT)
+    rules = standard.core_location(Rule=Rule, RuleList=RuleList)
+    # Line numbers are counted anew for each document.
+    for _ in range(2):
+        assert rules.sub(input_, file_name='f.tex') == expected